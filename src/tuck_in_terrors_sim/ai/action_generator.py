@@ -8,6 +8,9 @@ from ..game_elements.card import Card, CardType, EffectTriggerType, CardInstance
 from ..game_elements.enums import Zone
 from ..models.game_action_model import GameAction 
 
+# Triggers that make an effect a player-activated ability rather than a triggered one
+_ACTIVATABLE_TRIGGERS = frozenset({EffectTriggerType.ACTIVATED_ABILITY, EffectTriggerType.TAP_ABILITY})
+
 class ActionGenerator:
     def get_valid_actions(self, game_state: GameState) -> List[GameAction]:
         actions: List[GameAction] = []
@@ -37,7 +40,7 @@ class ActionGenerator:
                     )
                 )
             
-            if card_def.type == CardType.TOY and not active_player_state.has_played_free_toy_this_turn:
+            if card_def.type is CardType.TOY and not active_player_state.has_played_free_toy_this_turn:
                 actions.append(
                     GameAction(
                         type="PLAY_CARD",
@@ -54,15 +57,18 @@ class ActionGenerator:
                     card_in_play.effects_applied_this_turn = set() 
 
                 for i, effect_obj in enumerate(card_in_play.definition.effects): 
+                    # Most effects are triggered, not activated; skip them before any other work
+                    if effect_obj.trigger not in _ACTIVATABLE_TRIGGERS:
+                        continue
                     # Check if this effect has already been applied this turn
                     if effect_obj.effect_id in card_in_play.effects_applied_this_turn:
                         continue # Skip if already used this turn
 
                     can_activate_ability = False
-                    if effect_obj.trigger == EffectTriggerType.ACTIVATED_ABILITY:
+                    if effect_obj.trigger is EffectTriggerType.ACTIVATED_ABILITY:
                         # TODO: Check actual costs from effect_obj.cost
                         can_activate_ability = True 
-                    elif effect_obj.trigger == EffectTriggerType.TAP_ABILITY:
+                    elif effect_obj.trigger is EffectTriggerType.TAP_ABILITY:
                         if not card_in_play.is_tapped:
                             # TODO: Check actual costs from effect_obj.cost
                             can_activate_ability = True
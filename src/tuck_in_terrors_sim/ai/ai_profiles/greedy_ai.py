@@ -35,7 +35,7 @@ class GreedyAI(RandomAI):
                 if action.type == "PLAY_CARD":
                     card_id = action.params.get("card_id")
                     card_instance = game_state.get_card_instance(card_id)
-                    if card_instance and card_instance.definition.type == CardType.TOY:
+                    if card_instance and card_instance.definition.type is CardType.TOY:
                         toy_playing_actions.append(action)
 
             # If there are toy-playing actions available, choose one of them randomly.
@@ -19,7 +19,8 @@ class RandomAI(AIPlayerBase):
 
     def decide_action(self, game_state: 'GameState', possible_actions: List['GameAction']) -> Optional['GameAction']:
         if not possible_actions:
-            game_state.add_log_entry(f"AI P{self.player_id} (RandomAI): No possible actions to decide from.", "AI_DEBUG")
+            if game_state.debug_log_enabled:
+                game_state.add_log_entry(f"AI P{self.player_id} (RandomAI): No possible actions to decide from.", "AI_DEBUG")
             return None
         
         # Prefer non-pass actions if available
@@ -38,16 +39,17 @@ class RandomAI(AIPlayerBase):
         choice_type: Optional[PlayerChoiceType] = choice_context.get("choice_type")
         options: Optional[List[Any]] = choice_context.get("options")
         prompt = choice_context.get("prompt_text", f"AI P{self.player_id} making a choice")
-        game_state.add_log_entry(f"AI P{self.player_id} (RandomAI) sees choice: {prompt} (Type: {choice_type}, Options: {options})", "AI_DEBUG")
+        if game_state.debug_log_enabled:
+            game_state.add_log_entry(f"AI P{self.player_id} (RandomAI) sees choice: {prompt} (Type: {choice_type}, Options: {options})", "AI_DEBUG")
 
         player_s = game_state.get_player_state(self.player_id) # Get player state for context
 
-        if choice_type == PlayerChoiceType.CHOOSE_YES_NO:
+        if choice_type is PlayerChoiceType.CHOOSE_YES_NO:
             decision = self.rng.choice([True, False])
             game_state.add_log_entry(f"AI P{self.player_id} chose: {'YES' if decision else 'NO'} for '{prompt}'", "AI_CHOICE")
             return decision
         
-        elif choice_type == PlayerChoiceType.DISCARD_CARD_OR_SACRIFICE_SPIRIT:
+        elif choice_type is PlayerChoiceType.DISCARD_CARD_OR_SACRIFICE_SPIRIT:
             can_discard = False
             if player_s and player_s.zones.get(Zone.HAND):
                 can_discard = True
@@ -90,7 +92,8 @@ class RandomAI(AIPlayerBase):
         if actual_num_to_choose == 0 and num_targets > 0: return []
         
         chosen_targets = self.rng.sample(potential_targets, actual_num_to_choose)
-        game_state.add_log_entry(f"AI P{self.player_id} chose targets: {chosen_targets}", "AI_DEBUG")
+        if game_state.debug_log_enabled:
+            game_state.add_log_entry(f"AI P{self.player_id} chose targets: {chosen_targets}", "AI_DEBUG")
         return chosen_targets
 
     def choose_cards_to_discard(self, game_state: 'GameState', num_to_discard: int, reason: Optional[str] = None) -> List[str]:
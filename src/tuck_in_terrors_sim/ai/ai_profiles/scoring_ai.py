@@ -24,7 +24,7 @@ class ScoringAI(RandomAI):
             return 1.0 if action.type != "PASS_TURN" else 0
 
         progress = game_state.objective_progress
-        toys_played_count = len(progress.get("distinct_toys_played_ids", set()))
+        toys_played_count = len(progress.get("distinct_toys_played_ids", ()))
         spirits_created_count = progress.get("spirits_created_total_game", 0)
 
         toys_needed_to_win = win_con.params.get("toys_needed", 4)
@@ -38,12 +38,12 @@ class ScoringAI(RandomAI):
             if not card_instance:
                 return score
 
-            if card_instance.definition.type == CardType.TOY:
+            if card_instance.definition.type is CardType.TOY:
                 if toys_played_count < toys_needed_to_win:
                     score += 10
 
             creates_spirits = any(
-                ea.action_type == EffectActionType.CREATE_SPIRIT_TOKENS
+                ea.action_type is EffectActionType.CREATE_SPIRIT_TOKENS
                 for effect in card_instance.definition.effects
                 for ea in effect.actions
             )
@@ -60,7 +60,7 @@ class ScoringAI(RandomAI):
         """Overrides the default random choice to make smarter decisions."""
         choice_type = choice_context.get("choice_type")
 
-        if choice_type == PlayerChoiceType.DISCARD_CARD_OR_SACRIFICE_SPIRIT:
+        if choice_type is PlayerChoiceType.DISCARD_CARD_OR_SACRIFICE_SPIRIT:
             player_state = game_state.get_player_state(self.player_id)
             if player_state and player_state.spirit_tokens > 0:
                 return "sacrifice"
@@ -1,5 +1,5 @@
 # src/tuck_in_terrors_sim/game_elements/card.py
-from typing import List, Dict, Any, Optional, Set, TYPE_CHECKING
+from typing import List, Dict, Any, Optional, Set, Tuple, Callable, TYPE_CHECKING
 
 # To handle List['CardInstance'] type hint if used for attachments
 if TYPE_CHECKING:
@@ -7,7 +7,8 @@ if TYPE_CHECKING:
 
 from .enums import (
     CardType, CardSubType, EffectTriggerType, EffectActionType,
-    EffectConditionType, Zone, ResourceType, EffectActivationCostType, PlayerChoiceType
+    EffectConditionType, Zone, ResourceType, EffectActivationCostType, PlayerChoiceType,
+    TargetReference
 )
 
 class Cost:
@@ -69,7 +70,37 @@ class Cost:
         return cls(cost_details=parsed_details)
 
 
+class EffectCondition:
+    """A single condition: its type plus the params the engine's handler reads."""
+    __slots__ = ("condition_type", "params")
+
+    def __init__(self, condition_type: EffectConditionType, params: Optional[Dict[str, Any]] = None):
+        self.condition_type = condition_type
+        self.params = params if params is not None else {}
+
+    def __repr__(self):
+        return f"EffectCondition(condition_type={self.condition_type.name}, params={self.params})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        serialized_params = {}
+        for k, v in self.params.items():
+            if isinstance(v, (Zone, CardType, ResourceType, EffectActionType, EffectConditionType, PlayerChoiceType, TargetReference)): # Added PlayerChoiceType
+                serialized_params[k] = v.name
+            else:
+                serialized_params[k] = v
+        return {"condition_type": self.condition_type.name, "params": serialized_params}
+
+
+# PLAYER_CHOICE params that drive the engine (branches and the choice type) rather than describe the choice to the AI
+_CHOICE_ENGINE_KEYS = frozenset({
+    "on_yes_actions", "on_no_actions", "on_selection_actions", "actions_map", "choice_type",
+    "on_discard_actions", "on_sacrifice_actions"
+})
+
+
 class EffectAction:
+    __slots__ = ("action_type", "params", "description", "count", "amount", "counter_type", "from_zone", "to_zone", "choice_context")
+
     def __init__(self,
                  action_type: EffectActionType, # Changed from 'type'
                  params: Dict[str, Any],
@@ -77,6 +108,21 @@ class EffectAction:
         self.action_type = action_type
         self.params = params
         self.description = description
+        # The params every handler reads, pulled out once; anything action-specific stays in params
+        self.count: int = params.get("count", 1)
+        self.amount: int = params.get("amount", 1)
+        self.counter_type: str = str(params.get("counter_type", "generic"))
+        self.from_zone: Optional[Zone] = params.get("from_zone") # Zone actions; None where the action names no zone
+        self.to_zone: Optional[Zone] = params.get("to_zone")
+        # The per-card part of the context a PLAYER_CHOICE hands to the AI, so each choice only adds the source/effect ids
+        self.choice_context: Optional[Dict[str, Any]] = None
+        if action_type is EffectActionType.PLAYER_CHOICE:
+            self.choice_context = {
+                "choice_type": params.get("choice_type"),
+                "prompt_text": params.get("prompt_text", "Make a choice:"),
+                "options": params.get("options"),
+                **{k: v for k, v in params.items() if k not in _CHOICE_ENGINE_KEYS}
+            }
 
     def __repr__(self):
         return f"EffectAction(action_type={self.action_type.name}, params={self.params})" # Changed 'type' to 'action_type'
@@ -84,11 +130,11 @@ class EffectAction:
     def to_dict(self) -> Dict[str, Any]:
         serialized_params = {}
         for key, value in self.params.items():
-            if isinstance(value, EffectAction):
+            if isinstance(value, (EffectAction, EffectCondition)):
                 serialized_params[key] = value.to_dict()
             elif isinstance(value, list) and value and all(isinstance(item, EffectAction) for item in value):
                 serialized_params[key] = [item.to_dict() for item in value]
-            elif isinstance(value, (Zone, CardType, ResourceType, EffectActionType, EffectConditionType, EffectActivationCostType, CardSubType, PlayerChoiceType)): # Added PlayerChoiceType
+            elif isinstance(value, (Zone, CardType, ResourceType, EffectActionType, EffectConditionType, EffectActivationCostType, CardSubType, PlayerChoiceType, TargetReference)): # Added PlayerChoiceType
                 serialized_params[key] = value.name
             elif isinstance(value, dict): 
                 serialized_params[key] = self._serialize_dict_enums(value)
@@ -106,7 +152,7 @@ class EffectAction:
     def _serialize_dict_enums(self, d: Dict[str, Any]) -> Dict[str, Any]:
         new_dict = {}
         for k, v in d.items():
-            if isinstance(v, (Zone, CardType, ResourceType, EffectActionType, EffectConditionType, EffectActivationCostType, CardSubType, PlayerChoiceType)):
+            if isinstance(v, (Zone, CardType, ResourceType, EffectActionType, EffectConditionType, EffectActivationCostType, CardSubType, PlayerChoiceType, TargetReference)):
                 new_dict[k] = v.name
             elif isinstance(v, dict):
                 new_dict[k] = self._serialize_dict_enums(v)
@@ -119,7 +165,7 @@ class EffectAction:
     def _serialize_list_enums(self, l: List[Any]) -> List[Any]:
         new_list = []
         for item in l:
-            if isinstance(item, (Zone, CardType, ResourceType, EffectActionType, EffectConditionType, EffectActivationCostType, CardSubType, PlayerChoiceType)):
+            if isinstance(item, (Zone, CardType, ResourceType, EffectActionType, EffectConditionType, EffectActivationCostType, CardSubType, PlayerChoiceType, TargetReference)):
                 new_list.append(item.name)
             elif isinstance(item, dict):
                 new_list.append(self._serialize_dict_enums(item))
@@ -131,11 +177,15 @@ class EffectAction:
 
 
 class Effect:
+    __slots__ = ("effect_id", "trigger", "actions", "condition", "cost", "description",
+                 "is_replacement_effect", "temporary_effect_data", "source_card_id", "compiled_actions",
+                 "compiled_by", "context_template")
+
     def __init__(self,
                  effect_id: str,
                  trigger: EffectTriggerType,
                  actions: List[EffectAction],
-                 condition: Optional[Dict[EffectConditionType, Any]] = None, 
+                 condition: Optional[EffectCondition] = None, 
                  cost: Optional[Cost] = None,
                  description: Optional[str] = "",
                  is_replacement_effect: bool = False,
@@ -151,6 +201,16 @@ class Effect:
         self.is_replacement_effect = is_replacement_effect
         self.temporary_effect_data = temporary_effect_data if temporary_effect_data is not None else {}
         self.source_card_id = source_card_id
+        # (handler function, action, checks_win) entries filled in by EffectEngine on first resolution. The plan is tied
+        # to the engine class in compiled_by; handlers swapped on that same class later are not picked up.
+        self.compiled_actions: Optional[Tuple[Tuple[Optional[Callable[..., Any]], EffectAction, bool], ...]] = None
+        self.compiled_by: Optional[type] = None
+        # The definition-level entries of EffectEngine's effect_context; copied and completed per resolution
+        self.context_template: Dict[str, Any] = {
+            "source_card_definition_id": source_card_id,
+            "effect_id": effect_id,
+            "trigger_type": trigger,
+        }
 
     def __repr__(self):
         return (f"Effect(id='{self.effect_id}', trigger={self.trigger.name}, "
@@ -158,22 +218,11 @@ class Effect:
                 f"cost_present={self.cost is not None})")
 
     def to_dict(self) -> Dict[str, Any]:
-        serialized_condition = None
-        if self.condition:
-            condition_type_enum, params_dict = list(self.condition.items())[0]
-            serialized_params = {}
-            for k, v in params_dict.items():
-                if isinstance(v, (Zone, CardType, ResourceType, EffectActionType, EffectConditionType, PlayerChoiceType)): # Added PlayerChoiceType
-                    serialized_params[k] = v.name
-                else:
-                    serialized_params[k] = v
-            serialized_condition = {"condition_type": condition_type_enum.name, "params": serialized_params}
-
         return {
             "effect_id": self.effect_id,
             "trigger": self.trigger.name, 
             "actions": [action.to_dict() for action in self.actions],
-            "condition": serialized_condition,
+            "condition": self.condition.to_dict() if self.condition else None,
             "cost": self.cost.to_dict() if self.cost else None,
             "description": self.description,
             "is_replacement_effect": self.is_replacement_effect,
@@ -228,6 +277,12 @@ class Card:
 
 
 class CardInstance:
+    # A deck's worth of these is built for every simulated game; fixed slots keep construction and attribute access cheap.
+    # effects_applied_this_turn is not set here; ActionGenerator creates it on first use.
+    __slots__ = ("instance_id", "definition", "owner_id", "controller_id", "current_zone", "previous_zone",
+                 "is_tapped", "counters", "attachments", "turn_entered_play", "turns_in_play",
+                 "abilities_granted_this_turn", "effects_active_this_turn", "effects_applied_this_turn",
+                 "chosen_modes", "custom_data")
     _next_instance_id: int = 1
 
     def __init__(self,
@@ -275,23 +330,22 @@ class CardInstance:
             return True
         return False
 
-    def add_counter(self, counter_type: str, amount: int = 1):
-        self.counters[counter_type] = self.counters.get(counter_type, 0) + amount
+    def add_counter(self, counter_type: str, amount: int = 1) -> int:
+        # Returns the new total so callers don't need to re-read the counters dict
+        new_total = self.counters.get(counter_type, 0) + amount
+        self.counters[counter_type] = new_total
+        return new_total
 
     def remove_counter(self, counter_type: str, amount: int = 1) -> bool:
-        current_amount = self.counters.get(counter_type, 0)
-        new_amount = max(0, current_amount - amount) # Ensure counter doesn't go below 0
-        
-        if new_amount == 0:
-            if counter_type in self.counters:
-                del self.counters[counter_type]
-                return True # Counter was present and removed
-            return False # Counter was not present or already 0
-        else:
-            if current_amount > 0 : # only update if there was a counter to begin with
-                self.counters[counter_type] = new_amount
-                return True
+        current_amount = self.counters.get(counter_type)
+        if current_amount is None:
             return False # No counter to remove from
+        new_amount = current_amount - amount
+        if new_amount <= 0: # Ensure counter doesn't go below 0
+            del self.counters[counter_type]
+        else:
+            self.counters[counter_type] = new_amount
+        return True
             
     def get_counter(self, counter_type: str) -> int:
         return self.counters.get(counter_type, 0)
@@ -299,10 +353,10 @@ class CardInstance:
     def change_zone(self, new_zone: Zone, game_turn: Optional[int] = None):
         self.previous_zone = self.current_zone
         self.current_zone = new_zone
-        if new_zone == Zone.IN_PLAY and self.previous_zone != Zone.IN_PLAY:
+        if new_zone is Zone.IN_PLAY and self.previous_zone is not Zone.IN_PLAY:
             self.turn_entered_play = game_turn
             self.is_tapped = False 
-        elif new_zone != Zone.IN_PLAY:
+        elif new_zone is not Zone.IN_PLAY:
             self.turn_entered_play = None 
 
 
@@ -1,14 +1,14 @@
 # src/tuck_in_terrors_sim/game_elements/data_loaders.py
 import json
 import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 # Assuming card.py, objective.py, and enums.py are now the corrected versions
-from .card import Card, Effect, EffectAction, Cost, Toy, Ritual, Spell 
+from .card import Card, Effect, EffectAction, EffectCondition, Cost, Toy, Ritual, Spell 
 from .objective import ObjectiveCard, ObjectiveLogicComponent 
 from .enums import (CardType, EffectTriggerType, EffectActionType, ResourceType,
                     EffectConditionType, Zone, CardSubType, EffectActivationCostType,
-                    PlayerChoiceType)
+                    PlayerChoiceType, TargetReference)
 
 # --- Configuration ---
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -20,6 +20,48 @@ DEFAULT_OBJECTIVES_FILE = os.path.join(BASE_DIR, "..", "..", "..", "data", "obje
 def _parse_cost(cost_data: Optional[Dict[str, Any]]) -> Optional[Cost]:
     return Cost.from_dict(cost_data)
 
+# Params that name a single card instance; "SELF"/"THIS" there means the source card.
+_TARGET_ID_PARAM_KEYS = ("target_card_id", "target_card_instance_id", "card_id")
+
+def _resolve_self_target_params(params: Dict[str, Any]) -> None:
+    for key in _TARGET_ID_PARAM_KEYS:
+        value = params.get(key)
+        if isinstance(value, str) and value.upper() in ("SELF", "THIS"):
+            params[key] = TargetReference.SELF
+
+# Params whose string values name an enum member; resolved once here so the engine compares members, not strings.
+_PARAM_ENUM_TYPES = {
+    "zone": Zone,
+    "from_zone": Zone,
+    "to_zone": Zone,
+    "card_type": CardType,
+    "resource_type": ResourceType,
+    "choice_type": PlayerChoiceType,
+    "trigger_type": EffectTriggerType,
+}
+
+# (enum_class, raw string) -> resolved member, or the string itself if it names no member.
+# The vocabulary is small, and Nightmare Creep re-parses its effect data every turn it applies.
+_ENUM_RESOLVE_CACHE: Dict[Tuple[type, str], Any] = {}
+
+def _resolve_param_enum(param_value: Any, enum_class: type) -> Any:
+    if isinstance(param_value, str):
+        cache_key = (enum_class, param_value)
+        resolved = _ENUM_RESOLVE_CACHE.get(cache_key)
+        if resolved is None:
+            try:
+                resolved = enum_class[param_value.upper()]
+            except KeyError:
+                resolved = param_value # Left as a string: action handlers log an ERROR and skip it, conditions never match it
+            _ENUM_RESOLVE_CACHE[cache_key] = resolved
+        return resolved
+    return param_value
+
+def _resolve_enum_params(params: Dict[str, Any]) -> None:
+    for param_key, enum_class in _PARAM_ENUM_TYPES.items():
+        if param_key in params:
+            params[param_key] = _resolve_param_enum(params[param_key], enum_class)
+
 # In src/tuck_in_terrors_sim/game_elements/data_loaders.py
 
 def _parse_effect_action(action_data: Dict[str, Any]) -> EffectAction:
@@ -54,25 +96,8 @@ def _parse_effect_action(action_data: Dict[str, Any]) -> EffectAction:
             except ValueError as e:
                 raise ValueError(f"Error parsing nested condition for CONDITIONAL_EFFECT: {e}")
 
-    def _resolve_param_enum(param_value: Any, enum_class: type) -> Any:
-        if isinstance(param_value, str):
-            try:
-                return enum_class[param_value.upper()]
-            except KeyError:
-                pass 
-        return param_value 
-
-    for param_key, param_value in params.items():
-        if param_key in ["zone", "from_zone", "to_zone"]:
-            params[param_key] = _resolve_param_enum(param_value, Zone)
-        elif param_key == "card_type" and "target_card_filter" not in params : 
-            params[param_key] = _resolve_param_enum(param_value, CardType)
-        elif param_key == "resource_type":
-            params[param_key] = _resolve_param_enum(param_value, ResourceType)
-        elif param_key == "choice_type": 
-            params[param_key] = _resolve_param_enum(param_value, PlayerChoiceType)
-        elif param_key == "trigger_type": 
-             params[param_key] = _resolve_param_enum(param_value, EffectTriggerType)
+    _resolve_enum_params(params)
+    _resolve_self_target_params(params)
 
     target_card_filter = params.get("target_card_filter")
     if target_card_filter and isinstance(target_card_filter, dict):
@@ -94,11 +119,10 @@ def _parse_effect_action(action_data: Dict[str, Any]) -> EffectAction:
         description=action_data.get("description", "")
     )
 
-def _parse_condition(condition_data: Optional[Dict[str, Any]]) -> Optional[Dict[EffectConditionType, Any]]:
+def _parse_condition(condition_data: Optional[Dict[str, Any]]) -> Optional[EffectCondition]:
     if not condition_data:
         return None
     
-    parsed_condition_dict = {}
     condition_type_str = condition_data.get("condition_type")
     if not condition_type_str:
         raise ValueError("Condition data must have a 'condition_type'.")
@@ -109,23 +133,10 @@ def _parse_condition(condition_data: Optional[Dict[str, Any]]) -> Optional[Dict[
 
     params = condition_data.get("params", {}).copy()
 
-    def _resolve_param_enum(param_value: Any, enum_class: type) -> Any:
-        if isinstance(param_value, str):
-            try:
-                return enum_class[param_value.upper()]
-            except KeyError:
-                pass
-        return param_value
-        
-    if "resource_type" in params:
-        params["resource_type"] = _resolve_param_enum(params["resource_type"], ResourceType)
-    if "card_type" in params: 
-        params["card_type"] = _resolve_param_enum(params["card_type"], CardType)
-    if "zone" in params: 
-        params["zone"] = _resolve_param_enum(params["zone"], Zone)
-
-    parsed_condition_dict[condition_type_enum] = params
-    return parsed_condition_dict
+    _resolve_enum_params(params)
+    _resolve_self_target_params(params)
+
+    return EffectCondition(condition_type_enum, params)
 
 
 def _parse_effect(effect_data: Dict[str, Any], card_name_context: str, card_id_context: str) -> Effect:
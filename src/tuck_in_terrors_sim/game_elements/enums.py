@@ -251,4 +251,7 @@ class PlayerChoiceType(Enum):
     CHOOSE_TOY_TO_SACRIFICE_OPTIONAL = auto()
     YES_NO_PAY_COST = auto()
     CHOOSE_MODAL_EFFECT = auto() # For test_random_ai.py
-    DISCARD_CARD_OR_SACRIFICE_SPIRIT = auto() # For test_random_ai.py
\ No newline at end of file
+    DISCARD_CARD_OR_SACRIFICE_SPIRIT = auto() # For test_random_ai.py
+
+class TargetReference(Enum):
+    SELF = auto() # Substituted by the data loader for "SELF"/"THIS" target ids
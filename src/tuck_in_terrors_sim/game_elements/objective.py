@@ -1,6 +1,6 @@
 # Defines Objective class, win conditions, setup logic
 # src/tuck_in_terrors_sim/game_elements/objective.py
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, FrozenSet
 # from .enums import ... # Import any enums needed for condition/action types if not already in effect_logic
 
 # Assuming EffectLogic structure from card.py can be reused for some objective-specific effects
@@ -60,6 +60,8 @@ class ObjectiveCard:
         self.setup_instructions = setup_instructions
         self.nightfall_turn = nightfall_turn
         self.card_rotation = card_rotation if card_rotation is not None else {"banned": [], "featured": []}
+        # Read by every game setup for this objective, so the set is built once here
+        self.banned_card_ids: FrozenSet[str] = frozenset(self.card_rotation.get("banned", [])) if isinstance(self.card_rotation, dict) else frozenset()
         self.special_rules_text = special_rules_text if special_rules_text is not None else []
 
     def __repr__(self):
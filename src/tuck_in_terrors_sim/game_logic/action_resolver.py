@@ -53,7 +53,7 @@ class ActionResolver:
             if active_player.has_played_free_toy_this_turn:
                 gs.add_log_entry(f"Action Error: Free Toy already played this turn. Cannot play '{card_def.name}'.", level="ERROR")
                 return False
-            if card_def.type != CardType.TOY:
+            if card_def.type is not CardType.TOY:
                 gs.add_log_entry(f"Action Error: '{card_def.name}' ({card_def.type.name}) is not a Toy for Free Toy Play.", level="ERROR")
                 return False
             gs.add_log_entry(f"P{active_player.player_id} attempts Free Toy Play: '{card_def.name}'.")
@@ -66,37 +66,41 @@ class ActionResolver:
             gs.add_log_entry(f"P{active_player.player_id} spent {card_def.cost_mana} mana. Mana: {active_player.mana}.")
 
         active_player.zones[Zone.HAND].pop(card_hand_idx)
-        gs.add_log_entry(f"'{played_card_instance.definition.name}' ({played_card_instance.instance_id}) removed from hand.", "ACTION_DETAIL")
-
-        # Create event context for triggers
-        play_event_context = {
-            'event_type': 'CARD_PLAYED',
-            'played_card_instance_id': played_card_instance.instance_id,
-            'played_card_definition_id': played_card_instance.definition.card_id,
-            'played_card_type': played_card_instance.definition.type,
-            'played_card_subtypes': played_card_instance.definition.subtypes,
-            'player_id': active_player.player_id,
-            'targets': targets
-        }
+        if gs.debug_log_enabled:
+            gs.add_log_entry(f"'{played_card_instance.definition.name}' ({played_card_instance.instance_id}) removed from hand.", "ACTION_DETAIL")
 
         # --- This logic is simplified for clarity, the original effect resolution is complex ---
         # A full implementation would gather and sort triggers from all sources before resolving.
         
         # Move card to final zone before resolving effects
-        if card_def.type == CardType.TOY or card_def.type == CardType.RITUAL:
+        if card_def.type is CardType.TOY or card_def.type is CardType.RITUAL:
             gs.move_card_zone(played_card_instance, Zone.IN_PLAY, active_player.player_id)
             gs.add_log_entry(f"P{active_player.player_id} played {card_def.type.name} '{card_def.name}' to play area.")
 
             # *** FIX IS HERE: Update objective progress for playing a toy ***
-            if card_def.type == CardType.TOY:
-                gs.objective_progress["toys_played_this_game_count"] = gs.objective_progress.get("toys_played_this_game_count", 0) + 1
+            if card_def.type is CardType.TOY:
+                gs.objective_progress["toys_played_this_game_count"] += 1
                 gs.objective_progress["distinct_toys_played_ids"].add(card_def.card_id)
-                gs.add_log_entry(f"Objective progress updated: Toy '{card_def.name}' played. Distinct toys: {len(gs.objective_progress['distinct_toys_played_ids'])}", "OBJECTIVE_DEBUG")
+                if gs.debug_log_enabled:
+                    gs.add_log_entry(f"Objective progress updated: Toy '{card_def.name}' played. Distinct toys: {len(gs.objective_progress['distinct_toys_played_ids'])}", "OBJECTIVE_DEBUG")
         
-        # Resolve ON_PLAY effects
+        # Resolve ON_PLAY effects. The event context for triggers is only built once
+        # an ON_PLAY effect is actually found, so vanilla cards skip the allocation.
+        play_event_context: Optional[Dict[str, Any]] = None
         for effect_obj in card_def.effects:
-            if effect_obj.trigger == EffectTriggerType.ON_PLAY:
+            if effect_obj.trigger is EffectTriggerType.ON_PLAY:
                 if gs.game_over: break
+                if play_event_context is None:
+                    play_event_context = {
+                        'event_type': 'CARD_PLAYED',
+                        'event_subject': played_card_instance, # The card the event is about, read by conditions/actions
+                        'played_card_instance_id': played_card_instance.instance_id,
+                        'played_card_definition_id': card_def.card_id,
+                        'played_card_type': card_def.type,
+                        'played_card_subtypes': card_def.subtypes,
+                        'player_id': active_player.player_id,
+                        'targets': targets
+                    }
                 self.effect_engine.resolve_effect(
                     effect=effect_obj,
                     game_state=gs,
@@ -106,7 +110,7 @@ class ActionResolver:
                 )
 
         # Handle post-resolution actions for spells
-        if card_def.type == CardType.SPELL:
+        if card_def.type is CardType.SPELL:
             if not gs.game_over:
                 gs.storm_count_this_turn += 1
                 gs.add_log_entry(f"Spell cast. Storm count is now: {gs.storm_count_this_turn}.")
@@ -136,7 +140,7 @@ class ActionResolver:
             gs.add_log_entry(f"Action Error: Card instance '{card_instance_id}' not found in game_state.cards_in_play.", level="ERROR")
             return False
 
-        if source_card_instance.current_zone != Zone.IN_PLAY:
+        if source_card_instance.current_zone is not Zone.IN_PLAY:
             gs.add_log_entry(f"Action Error: Card '{source_card_instance.definition.name}' must be in play to activate abilities.", level="ERROR")
             return False
         
@@ -150,7 +154,7 @@ class ActionResolver:
             return False
 
         ability_to_activate = card_def.effects[effect_index]
-        if ability_to_activate.trigger != EffectTriggerType.ACTIVATED_ABILITY: # CORRECTED ENUM
+        if ability_to_activate.trigger is not EffectTriggerType.ACTIVATED_ABILITY: # CORRECTED ENUM
             gs.add_log_entry(f"Action Error: Effect {effect_index} on '{card_def.name}' is not an ACTIVATED ability.", level="ERROR")
             return False
 
@@ -197,6 +201,7 @@ class ActionResolver:
         
         activation_event_context = {
             'event_type': 'ABILITY_ACTIVATED',
+            'event_subject': source_card_instance,
             'source_card_instance_id': source_card_instance.instance_id,
             'source_card_definition_id': card_def.card_id,
             'activated_effect_id': ability_to_activate.effect_id,
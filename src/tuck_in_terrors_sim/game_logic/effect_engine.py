@@ -1,9 +1,11 @@
 # src/tuck_in_terrors_sim/game_logic/effect_engine.py
-from typing import TYPE_CHECKING, List, Dict, Any, Optional
+from collections import deque
+from operator import attrgetter
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Callable, Tuple, Sequence
 
-from ..game_elements.card import Card, Effect, EffectAction, CardInstance
+from ..game_elements.card import Card, Effect, EffectAction, EffectCondition, CardInstance
 from ..game_elements.enums import (EffectActionType, EffectConditionType, Zone, ResourceType,
-                                   PlayerChoiceType, CardType)
+                                   PlayerChoiceType, CardType, TargetReference)
 from .game_state import PlayerState
 from ..ai.ai_player_base import AIPlayerBase
 
@@ -11,104 +13,140 @@ if TYPE_CHECKING:
     from .game_state import GameState
     from .win_loss_checker import WinLossChecker # Import WinLossChecker
 
+# Actions that can move a win/loss condition (objective counters, tokens, deck or play-area contents).
+# Anything else cannot end the game, so _execute_action skips the full objective check after it.
+WIN_RELEVANT_ACTIONS = frozenset({
+    EffectActionType.DRAW_CARDS,
+    EffectActionType.MILL_CARDS,
+    EffectActionType.ADD_MANA, # Feeds mana_from_card_effects_total_game
+    EffectActionType.CREATE_SPIRIT_TOKENS,
+    EffectActionType.CREATE_SPIRITS_FROM_STORM_COUNT,
+    EffectActionType.CREATE_MEMORY_TOKENS,
+    EffectActionType.RETURN_CARD_FROM_ZONE_TO_ZONE,
+    EffectActionType.RETURN_THIS_CARD_TO_HAND,
+    EffectActionType.EXILE_CARD_FROM_ZONE,
+    EffectActionType.SACRIFICE_RESOURCE,
+})
+
+# PlayerState counters that PLAYER_HAS_RESOURCE can test, by resource type
+_RESOURCE_GETTERS: Dict[ResourceType, Callable[[PlayerState], int]] = {
+    ResourceType.MANA: attrgetter("mana"),
+    ResourceType.SPIRIT_TOKENS: attrgetter("spirit_tokens"),
+    ResourceType.MEMORY_TOKENS: attrgetter("memory_tokens"),
+}
+
+# Spellings of a self-reference that may reach the engine in params built outside the data loader.
+# Checked by set membership so the fallback neither lowercases nor builds a tuple per call.
+_SELF_TARGET_NAMES = frozenset({"self", "this", "Self", "This", "SELF", "THIS"})
+
+# Shared "no sub-actions" result, so the common case doesn't allocate a fresh list per executed action
+_EMPTY_ACTIONS: Sequence[EffectAction] = ()
+
+# One step of a compiled effect: (unbound handler or None, action, whether to run the win check after it)
+CompiledAction = Tuple[Optional[Callable[..., Optional[Sequence[EffectAction]]]], EffectAction, bool]
 
 class EffectEngine:
     def __init__(self, game_state_ref: 'GameState', win_loss_checker: 'WinLossChecker'): # Modified __init__
         self.game_state_ref = game_state_ref
         self.win_loss_checker = win_loss_checker # Store WinLossChecker
 
+    def _resolve_target(self, target_id: Any, source_card_instance: Optional[CardInstance], game_state: 'GameState') -> Optional[CardInstance]:
+        if target_id is TargetReference.SELF: # Set by the data loader for "SELF"/"THIS"
+            return source_card_instance
+        if not target_id:
+            return None
+        if target_id in _SELF_TARGET_NAMES: # Params built outside the loader
+            return source_card_instance
+        return game_state.get_card_instance(target_id) # Instance ids are already the str keys of cards_in_play
+
 # In src/tuck_in_terrors_sim/game_logic/effect_engine.py, inside the EffectEngine class
 
     def check_condition(self,
-                        condition_data: Optional[Dict[EffectConditionType, Any]],
+                        condition: Optional[EffectCondition],
                         player: PlayerState,
                         card_instance: Optional[CardInstance],
                         game_state: 'GameState',
                         event_context: Optional[Dict[str, Any]] = None
                         ) -> bool:
-        if condition_data is None:
+        if condition is None:
             return True
 
-        if not condition_data or not isinstance(condition_data, dict) or not list(condition_data.items()):
-             game_state.add_log_entry(f"Warning: Malformed condition_data: {condition_data}", "ENGINE_DEBUG")
+        # The data loader only ever builds EffectCondition objects, so a malformed value is the rare case
+        try:
+            condition_type = condition.condition_type
+        except AttributeError:
+             if game_state.debug_log_enabled:
+                 game_state.add_log_entry(f"Warning: Malformed condition: {condition}", "ENGINE_DEBUG")
              return False
 
-        condition_type, params = list(condition_data.items())[0]
-
         if event_context is None:
             event_context = {}
 
-        # This block remains the same
-        def _resolve_param_enum(param_value: Any, enum_class: type) -> Any:
-            if isinstance(param_value, str):
-                try:
-                    return enum_class[param_value.upper()]
-                except KeyError:
-                    game_state.add_log_entry(f"Invalid enum string '{param_value}' for {enum_class.__name__} in condition params.", "WARNING")
-                    return None
-            return param_value
-
-        # All of the "if/elif condition_type ==" blocks remain the same
-        if condition_type == EffectConditionType.PLAYER_HAS_RESOURCE:
-            resource_type_param = params.get("resource_type")
-            resource_type = _resolve_param_enum(resource_type_param, ResourceType)
-            required_amount = params.get("amount", 1)
-            if not isinstance(resource_type, ResourceType):
-                game_state.add_log_entry(f"Invalid resource_type '{resource_type_param}' in PLAYER_HAS_RESOURCE condition.", "ERROR")
-                return False
-            if resource_type == ResourceType.MANA: return player.mana >= required_amount
-            if resource_type == ResourceType.SPIRIT_TOKENS: return player.spirit_tokens >= required_amount
-            if resource_type == ResourceType.MEMORY_TOKENS: return player.memory_tokens >= required_amount
-            return False
-        elif condition_type == EffectConditionType.DECK_SIZE_LE:
-            required_size = params.get("count", 0)
-            return len(player.zones[Zone.DECK]) <= required_size
-        elif condition_type == EffectConditionType.IS_FIRST_MEMORY_IN_PLAY:
-            fm_instance = game_state.get_first_memory_instance()
-            return fm_instance is not None and fm_instance.current_zone == Zone.IN_PLAY
-        elif condition_type == EffectConditionType.IS_FIRST_MEMORY_IN_DISCARD:
-            fm_instance = game_state.get_first_memory_instance()
-            if fm_instance and fm_instance.current_zone == Zone.DISCARD:
-                 owner_player_state = game_state.get_player_state(fm_instance.owner_id)
-                 if owner_player_state and fm_instance in owner_player_state.zones[Zone.DISCARD]:
-                     return True
-            return False
-        elif condition_type == EffectConditionType.CARD_IS_TAPPED:
-            return card_instance.is_tapped if card_instance else False
-        elif condition_type == EffectConditionType.EVENT_CARD_IS_TYPE:
-            event_card_inst = event_context.get("card_instance")
-            target_type_param = params.get("card_type")
-            target_type_enum = _resolve_param_enum(target_type_param, CardType)
-            if isinstance(event_card_inst, CardInstance) and isinstance(target_type_enum, CardType):
-                return event_card_inst.definition.type == target_type_enum
-            return False
-        elif condition_type == EffectConditionType.IS_MOVING_FROM_ZONE:
-            target_zone_param = params.get("zone")
-            target_zone_enum = _resolve_param_enum(target_zone_param, Zone)
-            moving_card_origin_zone_param = event_context.get("from_zone")
-            moving_card_origin_zone_enum = _resolve_param_enum(moving_card_origin_zone_param, Zone)
-            if isinstance(target_zone_enum, Zone) and isinstance(moving_card_origin_zone_enum, Zone):
-                return moving_card_origin_zone_enum == target_zone_enum
-            return False
-        elif condition_type == EffectConditionType.IS_MOVING_TO_ZONE:
-            target_zone_param = params.get("zone")
-            target_zone_enum = _resolve_param_enum(target_zone_param, Zone)
-            moving_card_destination_zone_param = event_context.get("to_zone")
-            moving_card_destination_zone_enum = _resolve_param_enum(moving_card_destination_zone_param, Zone)
-            if isinstance(target_zone_enum, Zone) and isinstance(moving_card_destination_zone_enum, Zone):
-                return moving_card_destination_zone_enum == target_zone_enum
-            return False
-        elif condition_type == EffectConditionType.HAS_COUNTER_TYPE_VALUE_GE:
-            if not card_instance: return False
-            counter_type_str = params.get("counter_type")
-            threshold = params.get("value", 1)
-            return card_instance.get_counter(str(counter_type_str)) >= threshold if counter_type_str else False
+        handler = self._CONDITION_HANDLERS.get(condition_type)
+        if handler is not None:
+            return handler(self, condition.params, player, card_instance, game_state, event_context)
 
         # *** FIX IS HERE: This logging is now safe and won't crash ***
-        condition_type_name = condition_type.name if hasattr(condition_type, 'name') else str(condition_type)
-        game_state.add_log_entry(f"Warning: Condition type '{condition_type_name}' not fully implemented. Defaulting to False.", "ENGINE_DEBUG")
+        if game_state.debug_log_enabled:
+            condition_type_name = condition_type.name if hasattr(condition_type, 'name') else str(condition_type)
+            game_state.add_log_entry(f"Warning: Condition type '{condition_type_name}' not fully implemented. Defaulting to False.", "ENGINE_DEBUG")
         return False
 
+    # --- Condition handlers ---
+
+    def _check_player_has_resource(self, params: Dict[str, Any], player: PlayerState, card_instance: Optional[CardInstance], game_state: 'GameState', event_context: Dict[str, Any]) -> bool:
+        resource_type = params.get("resource_type") # The data loader resolves known names to ResourceType
+        required_amount = params.get("amount", 1)
+        if resource_type is None:
+            game_state.add_log_entry("Missing resource_type in PLAYER_HAS_RESOURCE condition.", "ERROR")
+            return False
+        getter = _RESOURCE_GETTERS.get(resource_type)
+        return getter(player) >= required_amount if getter is not None else False
+
+    def _check_deck_size_le(self, params: Dict[str, Any], player: PlayerState, card_instance: Optional[CardInstance], game_state: 'GameState', event_context: Dict[str, Any]) -> bool:
+        required_size = params.get("count", 0)
+        return len(player.zones[Zone.DECK]) <= required_size
+
+    def _check_is_first_memory_in_play(self, params: Dict[str, Any], player: PlayerState, card_instance: Optional[CardInstance], game_state: 'GameState', event_context: Dict[str, Any]) -> bool:
+        fm_instance = game_state.get_first_memory_instance()
+        return fm_instance is not None and fm_instance.current_zone is Zone.IN_PLAY
+
+    def _check_is_first_memory_in_discard(self, params: Dict[str, Any], player: PlayerState, card_instance: Optional[CardInstance], game_state: 'GameState', event_context: Dict[str, Any]) -> bool:
+        fm_instance = game_state.get_first_memory_instance()
+        # current_zone is updated alongside the zone lists, so no need to scan the discard pile
+        return fm_instance is not None and fm_instance.current_zone is Zone.DISCARD
+
+    def _check_card_is_tapped(self, params: Dict[str, Any], player: PlayerState, card_instance: Optional[CardInstance], game_state: 'GameState', event_context: Dict[str, Any]) -> bool:
+        return card_instance.is_tapped if card_instance else False
+
+    def _check_event_card_is_type(self, params: Dict[str, Any], player: PlayerState, card_instance: Optional[CardInstance], game_state: 'GameState', event_context: Dict[str, Any]) -> bool:
+        event_card_inst = event_context.get("event_subject")
+        target_type_enum = params.get("card_type")
+        if event_card_inst is not None and target_type_enum is not None:
+            return event_card_inst.definition.type is target_type_enum
+        return False
+
+    def _check_is_moving_from_zone(self, params: Dict[str, Any], player: PlayerState, card_instance: Optional[CardInstance], game_state: 'GameState', event_context: Dict[str, Any]) -> bool:
+        target_zone_enum = params.get("zone")
+        moving_card_origin_zone_enum = event_context.get("from_zone")
+        if target_zone_enum is not None:
+            return moving_card_origin_zone_enum is target_zone_enum
+        return False
+
+    def _check_is_moving_to_zone(self, params: Dict[str, Any], player: PlayerState, card_instance: Optional[CardInstance], game_state: 'GameState', event_context: Dict[str, Any]) -> bool:
+        target_zone_enum = params.get("zone")
+        moving_card_destination_zone_enum = event_context.get("to_zone")
+        if target_zone_enum is not None:
+            return moving_card_destination_zone_enum is target_zone_enum
+        return False
+
+    def _check_has_counter_type_value_ge(self, params: Dict[str, Any], player: PlayerState, card_instance: Optional[CardInstance], game_state: 'GameState', event_context: Dict[str, Any]) -> bool:
+        counter_card = self._resolve_target(params.get("target_card_instance_id", TargetReference.SELF), card_instance, game_state)
+        if not counter_card: return False
+        counter_type_str = params.get("counter_type")
+        if not counter_type_str: return False
+        return counter_card.counters.get(str(counter_type_str), 0) >= params.get("value", 1)
+
     def resolve_effect(self,
                        effect: Effect,
                        game_state: 'GameState',
@@ -116,45 +154,80 @@ class EffectEngine:
                        source_card_instance: Optional[CardInstance] = None,
                        triggering_event_context: Optional[Dict[str, Any]] = None
                        ) -> List[EffectAction]: # Return type remains the same
-        all_generated_actions: List[EffectAction] = []
-
-        if not self.check_condition(effect.condition, player, source_card_instance, game_state, triggering_event_context):
-            game_state.add_log_entry(f"Condition for E'{effect.effect_id}'({effect.source_card_id or 'N/A'}) not met for P{player.player_id}.", "EFFECT_DEBUG")
-            return all_generated_actions
-
-        game_state.add_log_entry(f"Resolving E'{effect.effect_id}'({effect.description or 'No desc.'}) for P{player.player_id}.", "EFFECT_INFO")
-
-        controller_id_for_context = source_card_instance.controller_id if source_card_instance else player.player_id
-
-        effect_context = {
-            "player_id": controller_id_for_context,
-            "target_player_id": player.player_id,
-            "source_card_instance_id": source_card_instance.instance_id if source_card_instance else None,
-            "source_card_definition_id": source_card_instance.definition.card_id if source_card_instance else effect.source_card_id,
-            "effect_id": effect.effect_id,
-            "trigger_type": effect.trigger,
-            "triggering_event_context": triggering_event_context or {}
-        }
-
-        for action in effect.actions:
+        if not effect.actions: # Nothing to resolve; skip the condition check, log and context setup
+            return []
+
+        condition = effect.condition
+        if condition is not None and not self.check_condition(condition, player, source_card_instance, game_state, triggering_event_context):
+            if game_state.debug_log_enabled:
+                game_state.add_log_entry(f"Condition for E'{effect.effect_id}'({effect.source_card_id or 'N/A'}) not met for P{player.player_id}.", "EFFECT_DEBUG")
+            return []
+
+        if game_state.log_enabled: # Runs for every resolved effect; skip formatting when the log is discarded
+            game_state.add_log_entry(f"Resolving E'{effect.effect_id}'({effect.description or 'No desc.'}) for P{player.player_id}.", "EFFECT_INFO")
+
+        # Start from the effect's definition-level entries and fill in what depends on this resolution
+        effect_context = effect.context_template.copy()
+        effect_context["target_player_id"] = player.player_id
+        effect_context["triggering_event_context"] = triggering_event_context or {}
+        if source_card_instance is not None:
+            effect_context["player_id"] = source_card_instance.controller_id
+            effect_context["source_card_instance_id"] = source_card_instance.instance_id
+            effect_context["source_card_definition_id"] = source_card_instance.definition.card_id
+        else:
+            effect_context["player_id"] = player.player_id
+            effect_context["source_card_instance_id"] = None
+
+        compiled_actions = effect.compiled_actions
+        if compiled_actions is None or effect.compiled_by is not type(self):
+            # First resolution by this engine class; the plan stays on the shared definition for later games
+            compiled_actions = effect.compiled_actions = self._compile_actions(effect.actions)
+            effect.compiled_by = type(self)
+
+        # target_player_id is fixed for the whole effect and is normally the resolving player itself
+        target_player_id = effect_context["target_player_id"]
+        target_player = player if target_player_id == player.player_id else game_state.get_player_state(target_player_id)
+        if not target_player:
+            game_state.add_log_entry(f"Error: Target player for action not found: {target_player_id}", "ERROR")
+            return []
+
+        # Bound once; the loop below runs for every action of every resolved effect
+        run_action = self._run_action
+        compile_actions = self._compile_actions
+
+        if len(compiled_actions) == 1 and not game_state.game_over:
+            # Most card effects are a single action; run it directly and only build a queue if it produced sub-actions
+            handler, action, checks_win = compiled_actions[0]
+            sub_actions = run_action(handler, action, checks_win, game_state, target_player, effect_context, source_card_instance)
+            if not sub_actions:
+                return []
+            compiled_actions = compile_actions(sub_actions)
+
+        # Sub-actions from conditionals and choices are pushed onto the front of the queue instead of
+        # being run recursively, so they still resolve before the effect's next top-level action.
+        work = deque(compiled_actions)
+        while work:
             if game_state.game_over: # Check if a previous action in this effect ended the game
                 game_state.add_log_entry(f"Game ended mid-effect resolution of E'{effect.effect_id}'. Skipping further actions.", "EFFECT_INFO")
                 break
-
-            target_player_for_action = game_state.get_player_state(effect_context["target_player_id"])
-            if not target_player_for_action:
-                game_state.add_log_entry(f"Error: Target player for action not found: {effect_context['target_player_id']}", "ERROR")
-                continue
-
-            # _execute_action now returns a list of further pending actions (e.g. from nested choices)
-            # and internally checks for game over after its own execution.
-            pending_sub_actions = self._execute_action(
-                action=action, game_state=game_state, player=target_player_for_action,
-                effect_context=effect_context, card_instance=source_card_instance
-            )
-            all_generated_actions.extend(pending_sub_actions) # Keep collecting any further actions that might arise
-
-        return all_generated_actions
+            handler, action, checks_win = work.popleft()
+            # run_action checks for game over after its own execution and hands back any sub-actions to queue
+            sub_actions = run_action(handler, action, checks_win, game_state, target_player, effect_context, source_card_instance)
+            if sub_actions:
+                work.extendleft(reversed(compile_actions(sub_actions)))
+
+        return [] # Nested actions are drained above, so nothing is left pending for the caller
+
+    def _compile_actions(self, actions: Sequence[EffectAction]) -> Tuple[CompiledAction, ...]:
+        # Decides everything that depends only on the action type up front (its handler and whether it can
+        # affect a win condition), so resolution neither looks up the handler nor probes WIN_RELEVANT_ACTIONS.
+        # The handlers are unbound functions, so the plan is independent of this engine instance and can live on the Effect.
+        action_handlers = self._ACTION_HANDLERS
+        compiled = []
+        for action in actions:
+            action_type = action.action_type
+            compiled.append((action_handlers.get(action_type), action, action_type in WIN_RELEVANT_ACTIONS))
+        return tuple(compiled)
 
 # In src/tuck_in_terrors_sim/game_logic/effect_engine.py, inside the EffectEngine class
 
@@ -165,212 +238,267 @@ class EffectEngine:
                         effect_context: Dict[str, Any],
                         card_instance: Optional[CardInstance] = None
                         ) -> List[EffectAction]: # Return list of pending actions
+        # Runs one action outside resolve_effect, draining any sub-actions it queues the same way
+        work = deque(self._compile_actions([action]))
+        while work:
+            handler, queued_action, checks_win = work.popleft()
+            sub_actions = self._run_action(handler, queued_action, checks_win, game_state, player, effect_context, card_instance)
+            if game_state.game_over:
+                break
+            if sub_actions:
+                work.extendleft(reversed(self._compile_actions(sub_actions)))
+        return []
+
+    def _run_action(self,
+                    handler: Optional[Callable[..., Optional[Sequence[EffectAction]]]],
+                    action: EffectAction,
+                    checks_win: bool,
+                    game_state: 'GameState',
+                    player: PlayerState,
+                    effect_context: Dict[str, Any],
+                    card_instance: Optional[CardInstance]
+                    ) -> Sequence[EffectAction]:
         action_type = action.action_type
-        params = action.params
-        pending_actions: List[EffectAction] = []
 
-        game_state.add_log_entry(f"Exec: {action_type.name} for P{player.player_id}, Params: {params}", "ACTION_DETAIL")
+        if game_state.debug_log_enabled: # Skip formatting the params repr when tracing is off
+            game_state.add_log_entry(f"Exec: {action_type.name} for P{player.player_id}, Params: {action.params}", "ACTION_DETAIL")
+
+        if handler is None:
+            game_state.add_log_entry(f"Warning: Action type {action_type.name} not implemented in _execute_action.", "WARNING")
+        else:
+            sub_actions = handler(self, action, game_state, player, effect_context, card_instance)
+            if sub_actions is not None: # Control actions and aborted actions return without a win check
+                return sub_actions
+
+        # After any action that could change the game state relevant to winning:
+        if checks_win and not game_state.game_over: # Only check if game isn't already over
+            if self.win_loss_checker.check_all_conditions():
+                game_state.add_log_entry(
+                    f"Game over condition met mid-effect after action {action_type.name}. Status: {game_state.win_status}",
+                    "GAME_END"
+                )
 
-        # --- Standard Action Execution ---
-        if action_type == EffectActionType.DRAW_CARDS:
-            count = params.get("count", 1)
-            player.draw_cards(count, game_state)
-        elif action_type == EffectActionType.ADD_MANA:
-            amount = params.get("amount", 1)
-            player.mana += amount
+        return _EMPTY_ACTIONS
+
+    # --- Action handlers ---
+
+    def _do_draw_cards(self, action: EffectAction, game_state: 'GameState', player: PlayerState, effect_context: Dict[str, Any], card_instance: Optional[CardInstance]) -> Optional[Sequence[EffectAction]]:
+        count = action.count
+        player.draw_cards(count, game_state)
+        return None
+
+    def _do_add_mana(self, action: EffectAction, game_state: 'GameState', player: PlayerState, effect_context: Dict[str, Any], card_instance: Optional[CardInstance]) -> Optional[Sequence[EffectAction]]:
+        amount = action.amount
+        player.mana += amount
+        game_state.objective_progress["mana_from_card_effects_total_game"] += amount
+        if game_state.log_enabled: # Resource updates are plain int adds; the message is the costly part
             game_state.add_log_entry(f"P{player.player_id} gains {amount} mana. Total: {player.mana}")
-            game_state.objective_progress["mana_from_card_effects_total_game"] = \
-                game_state.objective_progress.get("mana_from_card_effects_total_game", 0) + amount
-        elif action_type == EffectActionType.CREATE_SPIRIT_TOKENS:
-            count = params.get("count", 1)
-            player.spirit_tokens += count
-            game_state.objective_progress["spirits_created_total_game"] = \
-                game_state.objective_progress.get("spirits_created_total_game", 0) + count
+        return None
+
+    def _do_create_spirit_tokens(self, action: EffectAction, game_state: 'GameState', player: PlayerState, effect_context: Dict[str, Any], card_instance: Optional[CardInstance]) -> Optional[Sequence[EffectAction]]:
+        count = action.count
+        player.spirit_tokens += count
+        game_state.objective_progress["spirits_created_total_game"] += count
+        if game_state.log_enabled:
             game_state.add_log_entry(f"P{player.player_id} creates {count} Spirit(s). Total: {player.spirit_tokens}")
-        elif action_type == EffectActionType.CREATE_SPIRITS_FROM_STORM_COUNT:
-            storm_value = game_state.storm_count_this_turn
-            amount_per_storm = params.get("amount_per_storm", 1)
-            spirits_from_storm = storm_value * amount_per_storm
-            if spirits_from_storm > 0:
-                player.spirit_tokens += spirits_from_storm
-                game_state.objective_progress["spirits_created_total_game"] = \
-                    game_state.objective_progress.get("spirits_created_total_game", 0) + spirits_from_storm
+        return None
+
+    def _do_create_spirits_from_storm_count(self, action: EffectAction, game_state: 'GameState', player: PlayerState, effect_context: Dict[str, Any], card_instance: Optional[CardInstance]) -> Optional[Sequence[EffectAction]]:
+        storm_value = game_state.storm_count_this_turn
+        amount_per_storm = action.params.get("amount_per_storm", 1)
+        spirits_from_storm = storm_value * amount_per_storm
+        if spirits_from_storm > 0:
+            player.spirit_tokens += spirits_from_storm
+            game_state.objective_progress["spirits_created_total_game"] += spirits_from_storm
+            if game_state.log_enabled:
                 game_state.add_log_entry(f"Storm count is {storm_value}. P{player.player_id} creates {spirits_from_storm} Spirit(s) from Storm. Total Spirits: {player.spirit_tokens}")
-            else:
-                game_state.add_log_entry(f"Storm count is {storm_value}. No additional Spirits created from Storm.", "EFFECT_DEBUG")
-        elif action_type == EffectActionType.CREATE_MEMORY_TOKENS:
-            count = params.get("count", 1)
-            player.memory_tokens += count
+        elif game_state.debug_log_enabled:
+            game_state.add_log_entry(f"Storm count is {storm_value}. No additional Spirits created from Storm.", "EFFECT_DEBUG")
+        return None
+
+    def _do_create_memory_tokens(self, action: EffectAction, game_state: 'GameState', player: PlayerState, effect_context: Dict[str, Any], card_instance: Optional[CardInstance]) -> Optional[Sequence[EffectAction]]:
+        count = action.count
+        player.memory_tokens += count
+        if game_state.log_enabled:
             game_state.add_log_entry(f"P{player.player_id} creates {count} Memory(s). Total: {player.memory_tokens}")
-        elif action_type == EffectActionType.MILL_CARDS: # Was MILL_DECK
-            count = params.get("count", 1)
-            player.mill_deck(count, game_state) # PlayerState.mill_deck
-        elif action_type == EffectActionType.PLACE_COUNTER_ON_CARD:
-            target_card_id_val = params.get("target_card_id", effect_context.get("chosen_target_id"))
-            if not target_card_id_val and card_instance:
-                 target_card_id_val = card_instance.instance_id
-            target_card_inst = game_state.get_card_instance(str(target_card_id_val)) if target_card_id_val else None
-            if target_card_inst:
-                counter_type = params.get("counter_type", "generic")
-                amount = params.get("amount", 1)
-                target_card_inst.add_counter(str(counter_type), amount)
-                game_state.add_log_entry(f"Placed {amount} '{counter_type}' on {target_card_inst.definition.name} ({target_card_inst.instance_id}).")
-            else:
-                game_state.add_log_entry(f"PLACE_COUNTER_ON_CARD: Target card ({target_card_id_val}) not found.", "WARNING")
-        elif action_type == EffectActionType.RETURN_THIS_CARD_TO_HAND:
-            if card_instance:
-                game_state.move_card_zone(card_instance, Zone.HAND, card_instance.owner_id)
+        return None
+
+    def _do_mill_cards(self, action: EffectAction, game_state: 'GameState', player: PlayerState, effect_context: Dict[str, Any], card_instance: Optional[CardInstance]) -> Optional[Sequence[EffectAction]]:
+        count = action.count
+        player.mill_deck(count, game_state) # PlayerState.mill_deck
+        return None
+
+    def _do_place_counter_on_card(self, action: EffectAction, game_state: 'GameState', player: PlayerState, effect_context: Dict[str, Any], card_instance: Optional[CardInstance]) -> Optional[Sequence[EffectAction]]:
+        params = action.params
+        target_card_id_val = params.get("target_card_id", effect_context.get("chosen_target_id"))
+        target_card_inst = self._resolve_target(target_card_id_val, card_instance, game_state) if target_card_id_val else card_instance
+        if target_card_inst:
+            counter_type = action.counter_type
+            amount = action.amount
+            new_total = target_card_inst.add_counter(counter_type, amount)
+            if game_state.log_enabled:
+                game_state.add_log_entry(f"Placed {amount} '{counter_type}' on {target_card_inst.definition.name} ({target_card_inst.instance_id}). Total: {new_total}")
+        else:
+            game_state.add_log_entry(f"PLACE_COUNTER_ON_CARD: Target card ({target_card_id_val}) not found.", "WARNING")
+        return None
+
+    def _do_return_this_card_to_hand(self, action: EffectAction, game_state: 'GameState', player: PlayerState, effect_context: Dict[str, Any], card_instance: Optional[CardInstance]) -> Optional[Sequence[EffectAction]]:
+        if card_instance:
+            game_state.move_card_zone(card_instance, Zone.HAND, card_instance.owner_id)
+        else:
+            game_state.add_log_entry("RETURN_THIS_CARD_TO_HAND failed: no source card_instance.", "ERROR")
+        return None
+
+    def _do_return_card_from_zone_to_zone(self, action: EffectAction, game_state: 'GameState', player: PlayerState, effect_context: Dict[str, Any], card_instance: Optional[CardInstance]) -> Optional[Sequence[EffectAction]]:
+        params = action.params
+        card_to_move_id = params.get("card_id", effect_context.get("chosen_target_id"))
+        card_to_move_instance = self._resolve_target(card_to_move_id, card_instance, game_state)
+        if card_to_move_instance:
+            from_zone_enum = action.from_zone
+            to_zone_enum = action.to_zone
+            target_player_id_for_zone_param = params.get("target_player_id")
+            target_player_id_for_zone = int(target_player_id_for_zone_param) if target_player_id_for_zone_param is not None else card_to_move_instance.owner_id
+            if not isinstance(from_zone_enum, Zone) or not isinstance(to_zone_enum, Zone):
+                game_state.add_log_entry(f"Invalid zones for RETURN_CARD_FROM_ZONE_TO_ZONE: {from_zone_enum} to {to_zone_enum}", "ERROR")
+                return _EMPTY_ACTIONS
+            if card_to_move_instance.current_zone is from_zone_enum:
+                game_state.move_card_zone(card_to_move_instance, to_zone_enum, target_player_id_for_zone)
             else:
-                game_state.add_log_entry("RETURN_THIS_CARD_TO_HAND failed: no source card_instance.", "ERROR")
-        elif action_type == EffectActionType.RETURN_CARD_FROM_ZONE_TO_ZONE:
-            card_to_move_id = params.get("card_id", effect_context.get("chosen_target_id"))
-            card_to_move_instance = None
-            if str(card_to_move_id).lower() in ["self", "this"] and card_instance:
-                card_to_move_instance = card_instance
-            elif card_to_move_id:
-                card_to_move_instance = game_state.get_card_instance(str(card_to_move_id))
-            if card_to_move_instance:
-                from_zone_enum = params.get("from_zone")
-                to_zone_enum = params.get("to_zone")
-                target_player_id_for_zone_param = params.get("target_player_id")
-                target_player_id_for_zone = int(target_player_id_for_zone_param) if target_player_id_for_zone_param is not None else card_to_move_instance.owner_id
-                if not isinstance(from_zone_enum, Zone) or not isinstance(to_zone_enum, Zone):
-                    game_state.add_log_entry(f"Invalid zones for RETURN_CARD_FROM_ZONE_TO_ZONE: {from_zone_enum} to {to_zone_enum}", "ERROR")
-                    return pending_actions
-                if card_to_move_instance.current_zone == from_zone_enum:
-                    game_state.move_card_zone(card_to_move_instance, to_zone_enum, target_player_id_for_zone)
-                else:
-                    game_state.add_log_entry(f"Card {card_to_move_instance.definition.name} not in {from_zone_enum.name}. Actual: {card_to_move_instance.current_zone.name}", "WARNING")
+                game_state.add_log_entry(f"Card {card_to_move_instance.definition.name} not in {from_zone_enum.name}. Actual: {card_to_move_instance.current_zone.name}", "WARNING")
+        else:
+            game_state.add_log_entry(f"Could not find card '{card_to_move_id}' for RETURN_CARD_FROM_ZONE_TO_ZONE.", "WARNING")
+        return None
+
+    def _do_exile_card_from_zone(self, action: EffectAction, game_state: 'GameState', player: PlayerState, effect_context: Dict[str, Any], card_instance: Optional[CardInstance]) -> Optional[Sequence[EffectAction]]:
+        params = action.params
+        card_to_exile_id = params.get("card_id", effect_context.get("chosen_target_id"))
+        from_zone_enum = action.from_zone
+        if not isinstance(from_zone_enum, Zone):
+            game_state.add_log_entry(f"Invalid from_zone for EXILE_CARD_FROM_ZONE: {from_zone_enum}", "ERROR")
+            return _EMPTY_ACTIONS
+        card_to_exile_instance = self._resolve_target(card_to_exile_id, card_instance, game_state)
+        if card_to_exile_instance:
+            if card_to_exile_instance.current_zone is from_zone_enum:
+                game_state.move_card_zone(card_to_exile_instance, Zone.EXILE, card_to_exile_instance.owner_id)
             else:
-                game_state.add_log_entry(f"Could not find card '{card_to_move_id}' for RETURN_CARD_FROM_ZONE_TO_ZONE.", "WARNING")
-        elif action_type == EffectActionType.EXILE_CARD_FROM_ZONE:
-            card_to_exile_id = params.get("card_id", effect_context.get("chosen_target_id"))
-            from_zone_enum = params.get("from_zone")
-            if not isinstance(from_zone_enum, Zone):
-                game_state.add_log_entry(f"Invalid from_zone for EXILE_CARD_FROM_ZONE: {from_zone_enum}", "ERROR")
-                return pending_actions
-            card_to_exile_instance = game_state.get_card_instance(str(card_to_exile_id)) if card_to_exile_id else None
-            if card_to_exile_instance:
-                if card_to_exile_instance.current_zone == from_zone_enum:
-                    game_state.move_card_zone(card_to_exile_instance, Zone.EXILE, card_to_exile_instance.owner_id)
-                else:
-                    game_state.add_log_entry(f"Card {card_to_exile_instance.definition.name} not in {from_zone_enum.name} to be exiled.", "WARNING")
+                game_state.add_log_entry(f"Card {card_to_exile_instance.definition.name} not in {from_zone_enum.name} to be exiled.", "WARNING")
+        else:
+            count_to_exile = action.count
+            if from_zone_enum is Zone.DECK and player:
+                deck = player.zones[Zone.DECK]
+                for _ in range(count_to_exile):
+                    if deck:
+                        exiled_instance = deck.popleft()
+                        game_state.move_card_zone(exiled_instance, Zone.EXILE, exiled_instance.owner_id)
+                    else:
+                        game_state.add_log_entry(f"P{player.player_id} deck empty, cannot exile from deck.", "INFO")
+                        break
             else:
-                count_to_exile = params.get("count", 1)
-                if from_zone_enum == Zone.DECK and player:
-                    for _ in range(count_to_exile):
-                        if player.zones[Zone.DECK]:
-                            exiled_instance = player.zones[Zone.DECK].pop(0)
-                            game_state.move_card_zone(exiled_instance, Zone.EXILE, exiled_instance.owner_id)
-                        else:
-                            game_state.add_log_entry(f"P{player.player_id} deck empty, cannot exile from deck.", "INFO")
-                            break
-                else:
-                    game_state.add_log_entry(f"EXILE_CARD_FROM_ZONE needs target or better filter. CardID: {card_to_exile_id}, Zone: {from_zone_enum}", "WARNING")
-        elif action_type == EffectActionType.SACRIFICE_RESOURCE:
-            resource_param = params.get("resource_type")
-            amount = params.get("count", 1)
-            resource_type_enum = resource_param
-            if isinstance(resource_param, str):
-                try: resource_type_enum = ResourceType[resource_param.upper()]
-                except KeyError: game_state.add_log_entry(f"Invalid resource_type str '{resource_param}' for SACRIFICE_RESOURCE", "ERROR"); return pending_actions
-            if not isinstance(resource_type_enum, ResourceType):
-                 game_state.add_log_entry(f"Invalid resource_type obj '{resource_type_enum}' for SACRIFICE_RESOURCE", "ERROR"); return pending_actions
-            if resource_type_enum == ResourceType.SPIRIT_TOKENS: # Corrected Enum
-                if player.spirit_tokens >= amount: player.spirit_tokens -= amount; game_state.add_log_entry(f"P{player.player_id} sacrificed {amount} Spirit(s). Left: {player.spirit_tokens}")
-                else: game_state.add_log_entry(f"P{player.player_id} lacks {amount} Spirit(s) to sacrifice (has {player.spirit_tokens}).", "WARNING")
-            else: game_state.add_log_entry(f"Cannot sacrifice unimplemented resource: {resource_type_enum.name}", "WARNING")
-        elif action_type == EffectActionType.CONDITIONAL_EFFECT:
-            condition_data = params.get("condition")
-            condition_met = self.check_condition(condition_data, player, card_instance, game_state, effect_context.get("triggering_event_context"))
-            actions_to_run_data: List[Dict] = params.get("on_true_actions", []) if condition_met else params.get("on_false_actions", [])
-            # Convert action data to EffectAction objects if they are not already
-            actions_to_run: List[EffectAction] = [EffectAction(**ad) if isinstance(ad, dict) else ad for ad in actions_to_run_data]
-
-
-            for sub_action in actions_to_run:
-                if game_state.game_over: break
-                pending_actions.extend(self._execute_action(
-                    sub_action, game_state, player, effect_context, card_instance))
-            return pending_actions # Return collected pending actions
-        elif action_type == EffectActionType.PLAYER_CHOICE:
-            choice_type_param = params.get("choice_type")
-            choice_type_enum = choice_type_param
-            if isinstance(choice_type_param, str):
-                 try: choice_type_enum = PlayerChoiceType[choice_type_param.upper()]
-                 except KeyError: game_state.add_log_entry(f"Invalid PlayerChoiceType str '{choice_type_param}'", "ERROR"); return []
-            if not isinstance(choice_type_enum, PlayerChoiceType):
-                game_state.add_log_entry(f"Error: Invalid PlayerChoiceType obj '{choice_type_enum}'", "ERROR"); return []
-
-            choice_player_id = effect_context.get("player_id", game_state.active_player_id)
-            choice_player_agent = game_state.get_player_agent(choice_player_id)
-            if not choice_player_agent:
-                game_state.add_log_entry(f"Error: No AI agent for P{choice_player_id} for choice.", "ERROR"); return []
-
-            ai_params_for_choice = {k: v for k, v in params.items() if k not in ["on_yes_actions", "on_no_actions", "on_selection_actions", "actions_map", "choice_type", "on_discard_actions", "on_sacrifice_actions"]}
-            choice_context_for_ai = {
-                "choice_type": choice_type_enum,
-                "prompt_text": params.get("prompt_text", "Make a choice:"),
-                "source_card_instance_id": card_instance.instance_id if card_instance else None,
-                "effect_id": effect_context.get("effect_id"),
-                "options": params.get("options"),
-                **ai_params_for_choice
-            }
-            chosen_value = choice_player_agent.make_choice(game_state, choice_context_for_ai)
+                game_state.add_log_entry(f"EXILE_CARD_FROM_ZONE needs target or better filter. CardID: {card_to_exile_id}, Zone: {from_zone_enum}", "WARNING")
+        return None
+
+    def _do_sacrifice_resource(self, action: EffectAction, game_state: 'GameState', player: PlayerState, effect_context: Dict[str, Any], card_instance: Optional[CardInstance]) -> Optional[Sequence[EffectAction]]:
+        params = action.params
+        resource_type_enum = params.get("resource_type")
+        amount = action.count
+        if not isinstance(resource_type_enum, ResourceType):
+             game_state.add_log_entry(f"Invalid resource_type obj '{resource_type_enum}' for SACRIFICE_RESOURCE", "ERROR"); return _EMPTY_ACTIONS
+        if resource_type_enum is ResourceType.SPIRIT_TOKENS: # Corrected Enum
+            if player.spirit_tokens >= amount:
+                player.spirit_tokens -= amount
+                if game_state.log_enabled:
+                    game_state.add_log_entry(f"P{player.player_id} sacrificed {amount} Spirit(s). Left: {player.spirit_tokens}")
+            else: game_state.add_log_entry(f"P{player.player_id} lacks {amount} Spirit(s) to sacrifice (has {player.spirit_tokens}).", "WARNING")
+        else: game_state.add_log_entry(f"Cannot sacrifice unimplemented resource: {resource_type_enum.name}", "WARNING")
+        return None
+
+    def _do_conditional_effect(self, action: EffectAction, game_state: 'GameState', player: PlayerState, effect_context: Dict[str, Any], card_instance: Optional[CardInstance]) -> Optional[Sequence[EffectAction]]:
+        params = action.params
+        condition = params.get("condition")
+        condition_met = self.check_condition(condition, player, card_instance, game_state, effect_context.get("triggering_event_context"))
+        # The data loader already built these sub-action lists as EffectAction objects; the caller queues them
+        return params.get("on_true_actions", _EMPTY_ACTIONS) if condition_met else params.get("on_false_actions", _EMPTY_ACTIONS)
+
+    def _do_player_choice(self, action: EffectAction, game_state: 'GameState', player: PlayerState, effect_context: Dict[str, Any], card_instance: Optional[CardInstance]) -> Optional[Sequence[EffectAction]]:
+        params = action.params
+        choice_type_enum = params.get("choice_type")
+        if not isinstance(choice_type_enum, PlayerChoiceType):
+            game_state.add_log_entry(f"Error: Invalid PlayerChoiceType obj '{choice_type_enum}'", "ERROR"); return _EMPTY_ACTIONS
+
+        choice_player_id = effect_context.get("player_id", game_state.active_player_id)
+        choice_player_agent = game_state.get_player_agent(choice_player_id)
+        if not choice_player_agent:
+            game_state.add_log_entry(f"Error: No AI agent for P{choice_player_id} for choice.", "ERROR"); return _EMPTY_ACTIONS
+
+        choice_context_for_ai = action.choice_context.copy() # Prebuilt by EffectAction; copied so the AI can't alter the card
+        choice_context_for_ai["source_card_instance_id"] = card_instance.instance_id if card_instance else None
+        choice_context_for_ai["effect_id"] = effect_context.get("effect_id")
+        chosen_value = choice_player_agent.make_choice(game_state, choice_context_for_ai)
+        if game_state.debug_log_enabled:
             game_state.add_log_entry(f"P{choice_player_id} chose '{chosen_value}' for {choice_type_enum.name}.", "CHOICE_DEBUG")
 
-            sub_actions_to_run_data: List[Dict] = [] # Store as dicts first
-            current_effect_context = effect_context.copy()
-            if choice_type_enum == PlayerChoiceType.CHOOSE_YES_NO:
-                sub_actions_to_run_data = params.get("on_yes_actions", []) if chosen_value else params.get("on_no_actions", [])
-            elif choice_type_enum == PlayerChoiceType.DISCARD_CARD_OR_SACRIFICE_SPIRIT:
-                if chosen_value == "discard" or chosen_value is True:
-                     sub_actions_to_run_data = params.get("on_discard_actions", params.get("on_yes_actions", []))
-                elif chosen_value == "sacrifice" or chosen_value is False:
-                     sub_actions_to_run_data = params.get("on_sacrifice_actions", params.get("on_no_actions", []))
-                else:
-                     game_state.add_log_entry(f"Unhandled choice val '{chosen_value}' for DISCARD_CARD_OR_SACRIFICE_SPIRIT.", "WARNING")
-            elif action_type == EffectActionType.CANCEL_IMPENDING_LEAVE_PLAY: # Specific action related to choice
-                if 'triggering_event_context' in effect_context and 'card_instance_leaving_play' in effect_context['triggering_event_context']:
-                    card_leaving = effect_context['triggering_event_context']['card_instance_leaving_play']
-                    # This action itself doesn't generate sub-actions but modifies a flag or context
-                    # For now, we assume this is handled by the event system reacting to this action type.
-                    # A more direct way would be to set a flag in game_state or directly modify the event_context if it's mutable.
-                    game_state.add_log_entry(f"Action CANCEL_IMPENDING_LEAVE_PLAY for {card_leaving.definition.name} noted.", "EFFECT_DEBUG")
+        sub_actions_to_run: Sequence[EffectAction] = _EMPTY_ACTIONS # Lists of EffectAction, built by the data loader
+        if choice_type_enum is PlayerChoiceType.CHOOSE_YES_NO:
+            sub_actions_to_run = params.get("on_yes_actions", _EMPTY_ACTIONS) if chosen_value else params.get("on_no_actions", _EMPTY_ACTIONS)
+        elif choice_type_enum is PlayerChoiceType.DISCARD_CARD_OR_SACRIFICE_SPIRIT:
+            if chosen_value == "discard" or chosen_value is True:
+                 sub_actions_to_run = params.get("on_discard_actions", params.get("on_yes_actions", _EMPTY_ACTIONS))
+            elif chosen_value == "sacrifice" or chosen_value is False:
+                 sub_actions_to_run = params.get("on_sacrifice_actions", params.get("on_no_actions", _EMPTY_ACTIONS))
             else:
-                game_state.add_log_entry(f"Warning: PlayerChoiceType {choice_type_enum.name} outcome not fully implemented for sub-actions.", "WARNING")
-
-            # Convert action data to EffectAction objects
-            sub_actions_to_run: List[EffectAction] = [EffectAction(**ad) if isinstance(ad, dict) else ad for ad in sub_actions_to_run_data]
-
-            for sub_action in sub_actions_to_run:
-                if game_state.game_over: break
-                pending_actions.extend(self._execute_action(
-                    sub_action, game_state, player, current_effect_context, card_instance))
-            return pending_actions # Return collected pending actions
-        elif action_type == EffectActionType.CANCEL_IMPENDING_LEAVE_PLAY:
-            if 'triggering_event_context' in effect_context and \
-               'card_instance_leaving_play' in effect_context['triggering_event_context']:
-                card_leaving = effect_context['triggering_event_context']['card_instance_leaving_play']
+                 game_state.add_log_entry(f"Unhandled choice val '{chosen_value}' for DISCARD_CARD_OR_SACRIFICE_SPIRIT.", "WARNING")
+        else:
+            game_state.add_log_entry(f"Warning: PlayerChoiceType {choice_type_enum.name} outcome not fully implemented for sub-actions.", "WARNING")
+        return sub_actions_to_run # Queued by the caller
+
+    def _do_cancel_impending_leave_play(self, action: EffectAction, game_state: 'GameState', player: PlayerState, effect_context: Dict[str, Any], card_instance: Optional[CardInstance]) -> Optional[Sequence[EffectAction]]:
+        triggering_event_context = effect_context.get('triggering_event_context')
+        card_leaving = triggering_event_context.get('event_subject') if triggering_event_context else None
+        if card_leaving is None and triggering_event_context:
+            card_leaving = triggering_event_context.get('card_instance_leaving_play') # Older key, still accepted
+        if card_leaving is not None:
+            if game_state.log_enabled:
                 game_state.add_log_entry(
                     f"Action CANCEL_IMPENDING_LEAVE_PLAY for {card_leaving.definition.name} ({card_leaving.instance_id}) processed.",
                     "EFFECT_INFO"
                 )
-            else:
-                game_state.add_log_entry(
-                    "CANCEL_IMPENDING_LEAVE_PLAY called without proper context.",
-                    "WARNING"
-                )
         else:
-            game_state.add_log_entry(f"Warning: Action type {action_type.name} not implemented in _execute_action.", "WARNING")
-        # --- End of Standard Action Execution ---
-
-        # After any action that could change the game state relevant to winning:
-        if not game_state.game_over: # Only check if game isn't already over
-            if self.win_loss_checker.check_all_conditions():
-                game_state.add_log_entry(
-                    f"Game over condition met mid-effect after action {action_type.name}. Status: {game_state.win_status}",
-                    "GAME_END"
-                )
-
-        return pending_actions
\ No newline at end of file
+            game_state.add_log_entry(
+                "CANCEL_IMPENDING_LEAVE_PLAY called without proper context.",
+                "WARNING"
+            )
+        return None
+
+    # Dispatch tables, built once at class creation so each resolution is a single dict lookup instead of an
+    # if/elif chain. The handlers are stateless apart from self, so they are stored unbound and shared by all engines.
+    # Condition handlers take (self, params, player, card_instance, game_state, event_context) and return a bool.
+    _CONDITION_HANDLERS: Dict[EffectConditionType, Callable[..., bool]] = {
+        EffectConditionType.PLAYER_HAS_RESOURCE: _check_player_has_resource,
+        EffectConditionType.DECK_SIZE_LE: _check_deck_size_le,
+        EffectConditionType.IS_FIRST_MEMORY_IN_PLAY: _check_is_first_memory_in_play,
+        EffectConditionType.IS_FIRST_MEMORY_IN_DISCARD: _check_is_first_memory_in_discard,
+        EffectConditionType.CARD_IS_TAPPED: _check_card_is_tapped,
+        EffectConditionType.EVENT_CARD_IS_TYPE: _check_event_card_is_type,
+        EffectConditionType.IS_MOVING_FROM_ZONE: _check_is_moving_from_zone,
+        EffectConditionType.IS_MOVING_TO_ZONE: _check_is_moving_to_zone,
+        EffectConditionType.HAS_COUNTER_TYPE_VALUE_GE: _check_has_counter_type_value_ge,
+    }
+    # Action handlers take (self, action, game_state, player, effect_context, card_instance).
+    # Returning None means "done, run the win check"; returning a list skips the win check and queues the
+    # listed sub-actions (control actions return their chosen branch, aborted actions return _EMPTY_ACTIONS).
+    _ACTION_HANDLERS: Dict[EffectActionType, Callable[..., Optional[Sequence[EffectAction]]]] = {
+        EffectActionType.DRAW_CARDS: _do_draw_cards,
+        EffectActionType.ADD_MANA: _do_add_mana,
+        EffectActionType.CREATE_SPIRIT_TOKENS: _do_create_spirit_tokens,
+        EffectActionType.CREATE_SPIRITS_FROM_STORM_COUNT: _do_create_spirits_from_storm_count,
+        EffectActionType.CREATE_MEMORY_TOKENS: _do_create_memory_tokens,
+        EffectActionType.MILL_CARDS: _do_mill_cards,
+        EffectActionType.PLACE_COUNTER_ON_CARD: _do_place_counter_on_card,
+        EffectActionType.RETURN_THIS_CARD_TO_HAND: _do_return_this_card_to_hand,
+        EffectActionType.RETURN_CARD_FROM_ZONE_TO_ZONE: _do_return_card_from_zone_to_zone,
+        EffectActionType.EXILE_CARD_FROM_ZONE: _do_exile_card_from_zone,
+        EffectActionType.SACRIFICE_RESOURCE: _do_sacrifice_resource,
+        EffectActionType.CONDITIONAL_EFFECT: _do_conditional_effect,
+        EffectActionType.PLAYER_CHOICE: _do_player_choice,
+        EffectActionType.CANCEL_IMPENDING_LEAVE_PLAY: _do_cancel_impending_leave_play,
+    }
@@ -2,7 +2,9 @@
 # Logic for initializing GameState based on a chosen Objective
 
 import random
-from typing import List, Dict, Tuple, Optional
+from collections import deque
+from weakref import WeakKeyDictionary
+from typing import List, Dict, Tuple, Optional, Iterator
 
 from ..game_elements.enums import Zone, CardType, TurnPhase
 from ..game_elements.card import Card, CardInstance
@@ -12,39 +14,101 @@ from .game_state import GameState, PlayerState
 INITIAL_HAND_SIZE = 5
 DEFAULT_PLAYER_ID = 0
 
-def _build_deck_definitions(all_card_definitions: Dict[str, Card], current_objective: ObjectiveCard) -> List[Card]:
-    """Builds a list of Card definitions for the deck, considering objective bans."""
-    deck_defs: List[Card] = []
-    banned_card_ids_list = []
-    if current_objective.card_rotation and isinstance(current_objective.card_rotation, dict):
-        banned_card_ids_list = current_objective.card_rotation.get("banned", [])
-    
-    banned_card_ids_set = set(banned_card_ids_list)
+# Objective -> (the definitions dict it was built from, the unshuffled allowed definitions). Only the shuffle
+# differs between games of the same objective, so the ban filter runs once per objective rather than once per game.
+_DECK_TEMPLATE_CACHE = WeakKeyDictionary() # type: WeakKeyDictionary
+
+class DeckDefPool:
+    """The shuffled deck definitions during setup, indexed by card_id so named cards are pulled out without a scan."""
+    __slots__ = ("_cards", "_index", "_head", "_size")
+
+    def __init__(self, card_definitions: List[Card]):
+        # Removed slots are set to None rather than deleted, so positions in _index stay valid and the deck order is kept
+        self._cards: List[Optional[Card]] = card_definitions
+        self._index: Dict[str, int] = {card_def.card_id: i for i, card_def in enumerate(card_definitions)}
+        self._head: int = 0 # Position of the top card; everything before it has been taken
+        self._size: int = len(card_definitions)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Card]:
+        # Top to bottom
+        for i in range(self._head, len(self._cards)):
+            card_def = self._cards[i]
+            if card_def is not None:
+                yield card_def
+
+    def get(self, card_id: str) -> Optional[Card]:
+        i = self._index.get(card_id)
+        return self._cards[i] if i is not None else None
+
+    def pop_by_id(self, card_id: str) -> Optional[Card]:
+        i = self._index.pop(card_id, None)
+        if i is None:
+            return None
+        card_def = self._cards[i]
+        self._cards[i] = None
+        self._size -= 1
+        return card_def
+
+    def pop_top(self) -> Optional[Card]:
+        cards = self._cards
+        while self._head < len(cards):
+            card_def = cards[self._head]
+            self._head += 1
+            if card_def is not None:
+                del self._index[card_def.card_id]
+                self._size -= 1
+                return card_def
+        return None
 
-    for card_id, card_def in all_card_definitions.items():
-        if card_id not in banned_card_ids_set:
-            deck_defs.append(card_def)
+    def pop_first_of_type(self, card_type: CardType) -> Optional[Card]:
+        # Only used once per game (the First Memory fallback), so a single scan from the head beats keeping a per-type index
+        cards = self._cards
+        for i in range(self._head, len(cards)):
+            card_def = cards[i]
+            if card_def is not None and card_def.type is card_type:
+                cards[i] = None
+                del self._index[card_def.card_id]
+                self._size -= 1
+                return card_def
+        return None
+
+    def put_on_bottom(self, card_definitions: List[Card]) -> None:
+        for card_def in card_definitions:
+            self._index[card_def.card_id] = len(self._cards)
+            self._cards.append(card_def)
+            self._size += 1
+
+def _build_deck_definitions(all_card_definitions: Dict[str, Card], current_objective: ObjectiveCard, rng: Optional[random.Random] = None) -> DeckDefPool:
+    """Builds the pool of Card definitions for the deck, considering objective bans."""
+    cached = _DECK_TEMPLATE_CACHE.get(current_objective)
+    if cached is not None and cached[0] is all_card_definitions:
+        deck_template = cached[1]
+    else:
+        banned_card_ids_set = current_objective.banned_card_ids
+        deck_template = [card_def for card_id, card_def in all_card_definitions.items() if card_id not in banned_card_ids_set]
+        _DECK_TEMPLATE_CACHE[current_objective] = (all_card_definitions, deck_template)
+
+    deck_defs: List[Card] = deck_template.copy() # The pool tombstones and appends to its list, so it gets its own copy
 
     if not deck_defs and all_card_definitions:
         print(f"Warning: Deck definition list is empty after filtering for objective '{current_objective.title}'.")
     elif not deck_defs and not all_card_definitions:
         raise ValueError("Cannot build deck: all_card_definitions is empty.")
 
-    random.shuffle(deck_defs)
-    return deck_defs
+    (rng or random).shuffle(deck_defs)
+    return DeckDefPool(deck_defs)
 
 def _place_card_in_play_from_definitions(
     game_state: GameState,
-    available_card_definitions: List[Card],
+    available_card_definitions: DeckDefPool,
     card_id_to_place: str,
     player_id: int
 ) -> Optional[CardInstance]:
-    """Finds a card definition, creates an instance, places it in play, and removes def from list."""
-    found_card_def = None
-    for i, card_def in enumerate(available_card_definitions):
-        if card_def.card_id == card_id_to_place:
-            found_card_def = available_card_definitions.pop(i)
-            break
+    """Finds a card definition, creates an instance, places it in play, and removes def from the pool."""
+    found_card_def = available_card_definitions.pop_by_id(card_id_to_place)
     
     if found_card_def:
         instance = CardInstance(definition=found_card_def, owner_id=player_id, current_zone=Zone.IN_PLAY)
@@ -55,7 +119,8 @@ def _place_card_in_play_from_definitions(
         if player_state:
             player_state.zones[Zone.IN_PLAY].append(instance)
         
-        game_state.add_log_entry(f"Card '{found_card_def.name}' ({instance.instance_id}) placed into play for P{player_id} (Setup).")
+        if game_state.log_enabled:
+            game_state.add_log_entry(f"Card '{found_card_def.name}' ({instance.instance_id}) placed into play for P{player_id} (Setup).")
         return instance
     
     game_state.add_log_entry(f"Card def ID '{card_id_to_place}' for starting in play not found in available definitions.", level="WARNING")
@@ -63,24 +128,24 @@ def _place_card_in_play_from_definitions(
 
 def _add_card_def_to_hand_setup_list(
     game_state: GameState,
-    available_card_definitions: List[Card],
+    available_card_definitions: DeckDefPool,
     card_id_to_add: str,
     target_hand_definitions_list: List[Card]
 ) -> bool:
     """Finds a card definition, removes it from available_card_definitions, and adds it to target_hand_definitions_list."""
-    for i, card_def in enumerate(available_card_definitions):
-        if card_def.card_id == card_id_to_add:
-            card_to_hand_def = available_card_definitions.pop(i)
-            target_hand_definitions_list.append(card_to_hand_def)
+    card_to_hand_def = available_card_definitions.pop_by_id(card_id_to_add)
+    if card_to_hand_def:
+        target_hand_definitions_list.append(card_to_hand_def)
+        if game_state.log_enabled:
             game_state.add_log_entry(f"Card def '{card_to_hand_def.name}' designated for starting hand (Setup).")
-            return True
+        return True
             
     game_state.add_log_entry(f"Card def ID '{card_id_to_add}' for starting hand not found in available definitions.", level="WARNING")
     return False
 
 def _determine_and_prepare_first_memory(
     game_state: GameState,
-    deck_definitions_pool: List[Card], 
+    deck_definitions_pool: DeckDefPool, 
     hand_definitions_for_setup: List[Card],
     player_id: int
 ) -> None:
@@ -97,10 +162,10 @@ def _determine_and_prepare_first_memory(
     if fm_setup_logic.component_type == "CHOOSE_TOY_FROM_HAND_PLACE_IN_PLAY": # Implies from deck to play
         fm_id = fm_setup_logic.params.get("designated_first_memory_id")
         if not fm_id: game_state.add_log_entry("FM setup needs 'designated_first_memory_id'.", "ERROR"); return
-        for i, c_def in enumerate(deck_definitions_pool):
-            if c_def.card_id == fm_id:
-                if c_def.type == CardType.TOY: chosen_fm_card_def = deck_definitions_pool.pop(i); fm_target_disposition = Zone.IN_PLAY; break
-                else: game_state.add_log_entry(f"Designated FM '{fm_id}' not a TOY.", "ERROR"); return
+        c_def = deck_definitions_pool.get(fm_id)
+        if c_def:
+            if c_def.type is CardType.TOY: chosen_fm_card_def = deck_definitions_pool.pop_by_id(fm_id); fm_target_disposition = Zone.IN_PLAY
+            else: game_state.add_log_entry(f"Designated FM '{fm_id}' not a TOY.", "ERROR"); return
         if not chosen_fm_card_def: game_state.add_log_entry(f"Designated FM ID '{fm_id}' not in deck defs.", "ERROR"); return
             
     elif fm_setup_logic.component_type == "CHOOSE_TOY_FROM_TOP_X_DECK_TO_HAND":
@@ -112,23 +177,20 @@ def _determine_and_prepare_first_memory(
         # Look in top X
         for _ in range(min(count, len(deck_definitions_pool))): # Iterate 'count' times or until deck_definitions_pool is empty
             if not deck_definitions_pool: break # Stop if deck runs out
-            card_from_top = deck_definitions_pool.pop(0) # Take from top
-            if card_from_top.type == CardType.TOY and not found_toy_def:
+            card_from_top = deck_definitions_pool.pop_top() # Take from top
+            if card_from_top.type is CardType.TOY and not found_toy_def:
                 found_toy_def = card_from_top # Select first toy found
             else:
                 temp_selection_pool.append(card_from_top) # Add to temp pool if not the chosen toy or not a toy
         
         # Add remaining viewed cards from temp_selection_pool back to deck (conceptually bottom)
-        deck_definitions_pool.extend(temp_selection_pool) # Simplification: add to end, shuffle later if needed
+        deck_definitions_pool.put_on_bottom(temp_selection_pool) # Simplification: add to end, shuffle later if needed
 
         # If not in top X (or if specified by repeat_if_none_found, which isn't explicitly handled here but implied by full deck search)
         if not found_toy_def and fm_setup_logic.params.get("repeat_if_none_found", False): # Check repeat_if_none_found
             # Search rest of deck (excluding those already popped and in temp_selection_pool if logic was more complex)
             # Current simple approach: deck_definitions_pool now contains rest + non-chosen from top X
-            for i, c_def in enumerate(deck_definitions_pool):
-                if c_def.type == CardType.TOY:
-                    found_toy_def = deck_definitions_pool.pop(i)
-                    break
+            found_toy_def = deck_definitions_pool.pop_first_of_type(CardType.TOY)
         
         if found_toy_def:
             chosen_fm_card_def = found_toy_def
@@ -142,21 +204,22 @@ def _determine_and_prepare_first_memory(
     if chosen_fm_card_def and fm_target_disposition:
         player_s.first_memory_card_id = chosen_fm_card_def.card_id
 
-        if fm_target_disposition == Zone.IN_PLAY:
+        if fm_target_disposition is Zone.IN_PLAY:
             fm_instance = CardInstance(definition=chosen_fm_card_def, owner_id=player_id, current_zone=Zone.IN_PLAY)
             fm_instance.custom_data["is_first_memory"] = True
             fm_instance.turn_entered_play = game_state.current_turn
             game_state.cards_in_play[fm_instance.instance_id] = fm_instance
             player_s.zones[Zone.IN_PLAY].append(fm_instance)
             game_state.first_memory_instance_id = fm_instance.instance_id
-        elif fm_target_disposition == Zone.HAND:
+        elif fm_target_disposition is Zone.HAND:
             hand_definitions_for_setup.append(chosen_fm_card_def)
         
-        game_state.add_log_entry(f"FM '{chosen_fm_card_def.name}' designated for {fm_target_disposition.name} (Setup). Player FM ID set: {player_s.first_memory_card_id}")
+        if game_state.log_enabled:
+            game_state.add_log_entry(f"FM '{chosen_fm_card_def.name}' designated for {fm_target_disposition.name} (Setup). Player FM ID set: {player_s.first_memory_card_id}")
 
 def _apply_objective_specific_setup(
     game_state: GameState,
-    deck_definitions_pool: List[Card],
+    deck_definitions_pool: DeckDefPool,
     hand_definitions_for_setup: List[Card],
     player_id: int
 ) -> None:
@@ -188,15 +251,14 @@ def _apply_objective_specific_setup(
                     continue
 
                 # Remove its definition from hand_definitions_for_setup if it was put there by FM "to_hand" logic
-                original_hand_defs_len = len(hand_definitions_for_setup)
-                hand_definitions_for_setup[:] = [hd_def for hd_def in hand_definitions_for_setup if hd_def.card_id != player_s.first_memory_card_id]
-                if len(hand_definitions_for_setup) < original_hand_defs_len:
+                # Each definition is in the deck once, so there is at most one entry to drop; delete it in place
+                fm_hand_index = next((i for i, hd_def in enumerate(hand_definitions_for_setup) if hd_def.card_id == card_id), None)
+                if fm_hand_index is not None:
+                    del hand_definitions_for_setup[fm_hand_index]
                     game_state.add_log_entry(f"Removed FM def '{player_s.first_memory_card_id}' from hand_definitions_for_setup as it will start in play.")
 
                 # Safeguard: Remove from deck_definitions_pool (should have been popped by FM selection if from deck)
-                original_deck_pool_len = len(deck_definitions_pool)
-                deck_definitions_pool[:] = [dd_def for dd_def in deck_definitions_pool if dd_def.card_id != player_s.first_memory_card_id]
-                if len(deck_definitions_pool) < original_deck_pool_len:
+                if deck_definitions_pool.pop_by_id(player_s.first_memory_card_id):
                      game_state.add_log_entry(f"Removed FM def '{player_s.first_memory_card_id}' from deck_definitions_pool as it starts in play.")
 
                 # Create instance, place in play, mark as FM, set GameState's FM instance ID
@@ -208,10 +270,11 @@ def _apply_objective_specific_setup(
                 player_s.zones[Zone.IN_PLAY].append(instance)
                 game_state.first_memory_instance_id = instance.instance_id # CRITICAL ASSIGNMENT
                 
-                game_state.add_log_entry(
-                    f"First Memory '{instance.definition.name}' (ID: {instance.instance_id}) "
-                    f"placed into IN_PLAY (as per start_cards_in_play), marked, and GameState.first_memory_instance_id set."
-                )
+                if game_state.log_enabled:
+                    game_state.add_log_entry(
+                        f"First Memory '{instance.definition.name}' (ID: {instance.instance_id}) "
+                        f"placed into IN_PLAY (as per start_cards_in_play), marked, and GameState.first_memory_instance_id set."
+                    )
             # Case 2: The card to start in play is NOT the First Memory
             # OR the First Memory was already placed by _determine_and_prepare_first_memory (e.g., "OBJ01_THE_FIRST_NIGHT")
             else:
@@ -219,11 +282,12 @@ def _apply_objective_specific_setup(
                 fm_is_this_and_already_in_play = False
                 if game_state.first_memory_instance_id:
                     fm_inst = game_state.get_card_instance(game_state.first_memory_instance_id)
-                    if fm_inst and fm_inst.definition.card_id == card_id and fm_inst.current_zone == Zone.IN_PLAY:
+                    if fm_inst and fm_inst.definition.card_id == card_id and fm_inst.current_zone is Zone.IN_PLAY:
                         fm_is_this_and_already_in_play = True
                 
                 if fm_is_this_and_already_in_play:
-                    game_state.add_log_entry(f"Card '{card_id}' is already the instanced FM in play. Skipping redundant placement via start_cards_in_play.")
+                    if game_state.log_enabled:
+                        game_state.add_log_entry(f"Card '{card_id}' is already the instanced FM in play. Skipping redundant placement via start_cards_in_play.")
                     continue
                 
                 # If not the FM, or if it is the FM but already handled by direct FM placement,
@@ -233,61 +297,69 @@ def _apply_objective_specific_setup(
 
         if "first_turn_mana_override" in setup_params:
             player_s.mana = setup_params["first_turn_mana_override"]
-            game_state.add_log_entry(f"P{player_id}'s initial mana set to {player_s.mana} by objective.")
+            if game_state.log_enabled:
+                game_state.add_log_entry(f"P{player_id}'s initial mana set to {player_s.mana} by objective.")
     else:
         game_state.add_log_entry(f"Unknown setup instruction type: {component_type}", level="WARNING")
 
-def initialize_new_game(current_objective: ObjectiveCard, all_card_definitions: Dict[str, Card]) -> GameState:
-    game_state = GameState(loaded_objective=current_objective, all_card_definitions=all_card_definitions)
+def initialize_new_game(current_objective: ObjectiveCard, all_card_definitions: Dict[str, Card], silent_logging: bool = False,
+                        rng: Optional[random.Random] = None) -> GameState:
+    # rng lets parallel or reproducible runs give each game its own seeded random.Random instead of the shared module state
+    game_state = GameState(loaded_objective=current_objective, all_card_definitions=all_card_definitions, silent_logging=silent_logging)
+    game_state.rng = rng
     game_state.current_turn = 0 
-    game_state.add_log_entry(f"Init game for obj: {current_objective.title}")
+    if game_state.log_enabled:
+        game_state.add_log_entry(f"Init game for obj: {current_objective.title}")
 
     game_state.active_player_id = DEFAULT_PLAYER_ID
     player_s = PlayerState(player_id=DEFAULT_PLAYER_ID, initial_deck=[])
     game_state.player_states[DEFAULT_PLAYER_ID] = player_s
     
-    deck_defs_pool: List[Card] = _build_deck_definitions(all_card_definitions, current_objective)
-    game_state.add_log_entry(f"Built deck def list: {len(deck_defs_pool)} cards.")
+    deck_def_pool = _build_deck_definitions(all_card_definitions, current_objective, rng)
+    if game_state.log_enabled:
+        game_state.add_log_entry(f"Built deck def list: {len(deck_def_pool)} cards.")
 
     hand_defs_for_setup: List[Card] = []
 
-    _determine_and_prepare_first_memory(game_state, deck_defs_pool, hand_defs_for_setup, DEFAULT_PLAYER_ID)
-    _apply_objective_specific_setup(game_state, deck_defs_pool, hand_defs_for_setup, DEFAULT_PLAYER_ID)
+    _determine_and_prepare_first_memory(game_state, deck_def_pool, hand_defs_for_setup, DEFAULT_PLAYER_ID)
+    _apply_objective_specific_setup(game_state, deck_def_pool, hand_defs_for_setup, DEFAULT_PLAYER_ID)
 
     num_already_in_hand_list = len(hand_defs_for_setup)
     num_to_draw_additionally = max(0, INITIAL_HAND_SIZE - num_already_in_hand_list)
     
-    drawn_card_defs: List[Card] = []
-    if num_to_draw_additionally > 0:
-        actual_drawn_count = min(num_to_draw_additionally, len(deck_defs_pool))
-        drawn_card_defs = deck_defs_pool[:actual_drawn_count]
-        deck_defs_pool = deck_defs_pool[actual_drawn_count:]
-    
-    final_hand_definitions = hand_defs_for_setup + drawn_card_defs
+    # The opening hand comes off the pool's head cursor; the deck is whatever remains below it
+    final_hand_definitions = hand_defs_for_setup
+    for _ in range(min(num_to_draw_additionally, len(deck_def_pool))):
+        final_hand_definitions.append(deck_def_pool.pop_top())
 
     active_player = game_state.get_active_player_state()
     if active_player:
-        active_player.zones[Zone.DECK] = [CardInstance(definition=cd, owner_id=DEFAULT_PLAYER_ID, current_zone=Zone.DECK) for cd in deck_defs_pool]
-        active_player.zones[Zone.HAND] = [CardInstance(definition=cd, owner_id=DEFAULT_PLAYER_ID, current_zone=Zone.HAND) for cd in final_hand_definitions]
-        
-        # Mark FM instance in hand if applicable and GameState.first_memory_instance_id hasn't been set by in-play FM logic
-        if active_player.first_memory_card_id and not game_state.first_memory_instance_id:
-            found_fm_in_hand = False
-            for fm_hand_inst in active_player.zones[Zone.HAND]:
-                if fm_hand_inst.definition.card_id == active_player.first_memory_card_id:
-                    fm_hand_inst.custom_data["is_first_memory"] = True
-                    game_state.first_memory_instance_id = fm_hand_inst.instance_id # Assign GameState's tracked FM instance
-                    game_state.add_log_entry(f"First Memory '{fm_hand_inst.definition.name}' (ID: {fm_hand_inst.instance_id}) found in starting hand, marked, and GameState.first_memory_instance_id set.")
-                    found_fm_in_hand = True
-                    break 
-            if not found_fm_in_hand:
-                 game_state.add_log_entry(f"First Memory card ID '{active_player.first_memory_card_id}' was set, but no corresponding instance found in hand and not set from play.", level="WARNING")
+        active_player.zones[Zone.DECK] = deque(CardInstance(definition=cd, owner_id=DEFAULT_PLAYER_ID, current_zone=Zone.DECK) for cd in deck_def_pool)
+
+        # Mark the FM instance while building the hand, if GameState.first_memory_instance_id hasn't been set by in-play FM logic
+        fm_card_id_for_hand = active_player.first_memory_card_id if not game_state.first_memory_instance_id else None
+        hand_instances: List[CardInstance] = []
+        for cd in final_hand_definitions:
+            hand_inst = CardInstance(definition=cd, owner_id=DEFAULT_PLAYER_ID, current_zone=Zone.HAND)
+            if fm_card_id_for_hand and cd.card_id == fm_card_id_for_hand:
+                hand_inst.custom_data["is_first_memory"] = True
+                game_state.first_memory_instance_id = hand_inst.instance_id # Assign GameState's tracked FM instance
+                if game_state.log_enabled:
+                    game_state.add_log_entry(f"First Memory '{cd.name}' (ID: {hand_inst.instance_id}) found in starting hand, marked, and GameState.first_memory_instance_id set.")
+                fm_card_id_for_hand = None
+            hand_instances.append(hand_inst)
+        active_player.zones[Zone.HAND] = hand_instances
+
+        if fm_card_id_for_hand:
+            game_state.add_log_entry(f"First Memory card ID '{active_player.first_memory_card_id}' was set, but no corresponding instance found in hand and not set from play.", level="WARNING")
         
-        game_state.add_log_entry(f"P{DEFAULT_PLAYER_ID} init: Deck {len(active_player.zones[Zone.DECK])}, Hand {len(active_player.zones[Zone.HAND])}.")
+        if game_state.log_enabled:
+            game_state.add_log_entry(f"P{DEFAULT_PLAYER_ID} init: Deck {len(active_player.zones[Zone.DECK])}, Hand {len(active_player.zones[Zone.HAND])}.")
     
     game_state.current_turn = 1
     game_state.current_phase = TurnPhase.BEGIN_TURN
-    game_state.add_log_entry(f"Game setup complete. Turn {game_state.current_turn}.")
+    if game_state.log_enabled:
+        game_state.add_log_entry(f"Game setup complete. Turn {game_state.current_turn}.")
     return game_state
 
 if __name__ == '__main__':
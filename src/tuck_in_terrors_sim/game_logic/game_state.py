@@ -1,8 +1,9 @@
 # src/tuck_in_terrors_sim/game_logic/game_state.py
 # Defines GameState class for tracking all dynamic game info
 
+import random
+from collections import defaultdict, deque
 from typing import List, Dict, Any, Optional, Set # Added Set
-import uuid # For unique card instance IDs, though CardInstance handles its own
 
 # Assuming your enums and card/objective definitions are accessible
 # For relative imports from sibling directories (game_elements)
@@ -14,8 +15,26 @@ from ..ai.ai_player_base import AIPlayerBase
 
 # The CardInPlay class previously defined here is now superseded by CardInstance from card.py
 
+# Log levels that only carry engine tracing. Entries at these levels are dropped
+# (and callers can skip formatting them) when GameState.debug_log_enabled is False.
+DEBUG_LOG_LEVELS = frozenset({
+    "DEBUG", "ENGINE_DEBUG", "EFFECT_DEBUG", "ACTION_DETAIL",
+    "CHOICE_DEBUG", "AI_DEBUG", "OBJECTIVE_DEBUG",
+})
+
+# Zones that always belong to the card's owner, whoever controlled it before
+OWNER_ONLY_ZONES = frozenset({Zone.DISCARD, Zone.EXILE})
+
+# Log levels that report a data or setup problem; games created with silent_logging still record these.
+PROBLEM_LOG_LEVELS = frozenset({"ERROR", "WARNING"})
+
 class PlayerState: # Assuming a single-player game, this can be integrated or kept separate
     """Holds state specific to the player."""
+    # Fixed attribute set: mana/token reads in conditions and handlers go through slot descriptors
+    __slots__ = ("player_id", "deck", "hand", "discard_pile", "exile_zone", "set_aside_zone",
+                 "mana", "spirit_tokens", "memory_tokens", "zones",
+                 "has_played_free_toy_this_turn", "first_memory_card_id")
+
     def __init__(self, player_id: int, initial_deck: List[Card]):
         self.player_id = player_id
         self.deck: List[Card] = initial_deck # List of Card definitions
@@ -29,7 +48,7 @@ class PlayerState: # Assuming a single-player game, this can be integrated or ke
         self.memory_tokens: int = 0
         
         self.zones: Dict[Zone, List[CardInstance]] = {
-            Zone.DECK: [], # Will store CardInstance objects; initial deck of Card defs needs conversion
+            Zone.DECK: deque(), # Top of deck is the left end; a deque so draws/mills pop it in O(1)
             Zone.HAND: self.hand,
             Zone.DISCARD: self.discard_pile,
             Zone.EXILE: self.exile_zone,
@@ -46,32 +65,38 @@ class PlayerState: # Assuming a single-player game, this can be integrated or ke
         self._initialize_deck_with_instances(initial_deck)
 
     def _initialize_deck_with_instances(self, initial_deck_definitions: List[Card]):
-        self.zones[Zone.DECK] = [CardInstance(definition=card_def, owner_id=self.player_id, current_zone=Zone.DECK) for card_def in initial_deck_definitions]
+        self.zones[Zone.DECK] = deque(CardInstance(definition=card_def, owner_id=self.player_id, current_zone=Zone.DECK) for card_def in initial_deck_definitions)
 
 
     def draw_cards(self, count: int, game_state: 'GameState'): # Added game_state for logging
-        drawn_instances = []
-        for _ in range(count):
-            if self.zones[Zone.DECK]:
-                card_instance = self.zones[Zone.DECK].pop(0) # Draw from top (index 0)
-                card_instance.change_zone(Zone.HAND, game_state.current_turn)
-                self.zones[Zone.HAND].append(card_instance)
-                drawn_instances.append(card_instance)
-                game_state.add_log_entry(f"Player {self.player_id} drew {card_instance.definition.name} ({card_instance.instance_id})")
-            else:
-                game_state.add_log_entry(f"Player {self.player_id} tried to draw, but deck is empty.", level="WARNING")
-                # TODO: Implement loss condition for drawing from empty deck if applicable
-                break
+        deck = self.zones[Zone.DECK]
+        num_to_draw = min(count, len(deck))
+        # Take the whole batch off the top (left end) of the deque
+        popleft = deck.popleft
+        drawn_instances = [popleft() for _ in range(num_to_draw)]
+        current_turn = game_state.current_turn
+        for card_instance in drawn_instances:
+            card_instance.change_zone(Zone.HAND, current_turn)
+        self.zones[Zone.HAND].extend(drawn_instances)
+        if drawn_instances and game_state.log_enabled:
+            drawn_info = ", ".join(f"{ci.definition.name} ({ci.instance_id})" for ci in drawn_instances)
+            game_state.add_log_entry(f"Player {self.player_id} drew: {drawn_info}.")
+        if num_to_draw < count:
+            game_state.add_log_entry(f"Player {self.player_id} tried to draw, but deck is empty.", level="WARNING")
+            # TODO: Implement loss condition for drawing from empty deck if applicable
         return drawn_instances
 
     def mill_deck(self, count: int, game_state: 'GameState'): # Added game_state
         milled_cards_info = []
+        log_enabled = game_state.log_enabled # Names are only formatted when the log is kept
+        deck = self.zones[Zone.DECK]
         for _ in range(count):
-            if self.zones[Zone.DECK]:
-                card_instance = self.zones[Zone.DECK].pop(0)
+            if deck:
+                card_instance = deck.popleft()
                 card_instance.change_zone(Zone.DISCARD, game_state.current_turn)
                 self.zones[Zone.DISCARD].append(card_instance)
-                milled_cards_info.append(f"{card_instance.definition.name} ({card_instance.instance_id})")
+                if log_enabled:
+                    milled_cards_info.append(f"{card_instance.definition.name} ({card_instance.instance_id})")
             else:
                 game_state.add_log_entry(f"Player {self.player_id} deck empty, cannot mill further.", level="INFO")
                 break
@@ -83,7 +108,14 @@ class GameState:
     """
     Holds all the dynamic information for a single game instance of Tuck'd-In Terrors.
     """
-    def __init__(self, loaded_objective: ObjectiveCard, all_card_definitions: Dict[str, Card]):
+    # One per simulated game and read on every action; a fixed layout also turns a mistyped attribute into an error
+    __slots__ = ("current_objective", "all_card_definitions", "player_states", "active_player_id", "cards_in_play",
+                 "first_memory_instance_id", "current_turn", "_current_phase", "_phase_name",
+                 "nightmare_creep_effect_applied_this_turn", "nightmare_creep_skipped_this_turn", "objective_progress",
+                 "game_over", "win_status", "reason_for_game_end", "storm_count_this_turn", "rng",
+                 "game_log", "log_enabled", "debug_log_enabled", "ai_agents",
+                 "replacement_effects", "triggered_effects_queue")
+    def __init__(self, loaded_objective: ObjectiveCard, all_card_definitions: Dict[str, Card], silent_logging: bool = False):
         # Core Game Identifiers & Data
         self.current_objective: ObjectiveCard = loaded_objective
         self.all_card_definitions: Dict[str, Card] = all_card_definitions # For easy lookup
@@ -103,7 +135,8 @@ class GameState:
 
         # Turn & Phase Tracking
         self.current_turn: int = 0 # Will be set to 1 by game_setup
-        self.current_phase: Optional[TurnPhase] = None
+        self._current_phase: Optional[TurnPhase] = None
+        self._phase_name: str = "SETUP" # Prefix for log entries, kept in step with current_phase by its setter
 
         # Nightmare Creep Tracking
         self.nightmare_creep_effect_applied_this_turn: bool = False
@@ -117,8 +150,16 @@ class GameState:
         self.win_status: Optional[str] = None # E.g., "PRIMARY_WIN", "ALTERNATIVE_WIN", "LOSS_NIGHTFALL"
         self.reason_for_game_end: str = ""
         self.storm_count_this_turn: int = 0 # ADDED FOR STORM MECHANIC
+        # Source of the game's randomness (deck shuffle, forced discards); None falls back to the module-level random functions
+        self.rng: Optional[random.Random] = None
 
         self.game_log: List[str] = []
+        self.log_enabled: bool = True # False when only ERROR/WARNING entries are kept; callers can skip building the rest
+        self.debug_log_enabled: bool = True # Set False in bulk runs to skip DEBUG_LOG_LEVELS entries
+        if silent_logging:
+            # Bulk Monte Carlo runs never read the game flow, so only problem reports are kept
+            self.log_enabled = False
+            self.debug_log_enabled = False
         self.ai_agents: Dict[int, AIPlayerBase] = {} # player_id -> AIPlayerBase instance
         
         # Global effects or state modifiers
@@ -126,7 +167,9 @@ class GameState:
         self.triggered_effects_queue: List[Dict[str, Any]] = [] # Effects waiting to go on stack
 
     def _initialize_objective_progress(self) -> Dict[str, Any]:
-        progress = {
+        # Known counters are seeded so reporting sees them even at zero; the int default
+        # lets any new counter be bumped in place (progress[key] += n) without a .get() fallback.
+        progress: Dict[str, Any] = defaultdict(int, {
             # OBJ01: The First Night
             "toys_played_this_game_count": 0,
             "distinct_toys_played_ids": set(),
@@ -158,7 +201,7 @@ class GameState:
             "whispering_doll_total_rolls": 0,
             "memory_tokens_spent_game": 0,
             "cards_played_from_exile": 0,
-        }
+        })
 
         if self.current_objective and self.current_objective.primary_win_condition:
             pwc_params = self.current_objective.primary_win_condition.params
@@ -174,22 +217,35 @@ class GameState:
 
         return progress
 
+    @property
+    def current_phase(self) -> Optional[TurnPhase]:
+        return self._current_phase
+
+    @current_phase.setter
+    def current_phase(self, phase: Optional[TurnPhase]) -> None:
+        # Phases change a few times per turn but every log entry shows the name; resolve it once here
+        self._current_phase = phase
+        self._phase_name = phase.name if phase else "SETUP"
+
     def add_log_entry(self, message: str, level: str = "INFO"):
-        turn_info = f"T{self.current_turn}"
-        phase_info = self.current_phase.name if self.current_phase else "SETUP"
-        self.game_log.append(f"[{level}][{turn_info}][{phase_info}] {message}")
+        if not self.log_enabled and level not in PROBLEM_LOG_LEVELS: # Silent games keep only errors and warnings
+            return
+        if not self.debug_log_enabled and level in DEBUG_LOG_LEVELS:
+            return
+        self.game_log.append(f"[{level}][T{self.current_turn}][{self._phase_name}] {message}")
 
     def get_card_instance(self, instance_id: Optional[str]) -> Optional[CardInstance]:
         if not instance_id:
             return None
-        # Check cards in play first
-        if instance_id in self.cards_in_play:
-            return self.cards_in_play[instance_id]
+        # Check cards in play first; a single .get instead of a membership test plus an index
+        card_instance = self.cards_in_play.get(instance_id)
+        if card_instance is not None:
+            return card_instance
         
         # Check other zones for all players (assuming player_states is populated)
         for player_id, player_state in self.player_states.items():
             for zone, card_list in player_state.zones.items():
-                if zone == Zone.IN_PLAY: continue # Already checked via self.cards_in_play
+                if zone is Zone.IN_PLAY: continue # Already checked via self.cards_in_play
                 for card_instance in card_list:
                     if card_instance.instance_id == instance_id:
                         return card_instance
@@ -221,7 +277,7 @@ class GameState:
         if active_player and active_player.first_memory_card_id:
             # Search non-play zones for an instance matching the FM definition ID
             for zone_type, card_list in active_player.zones.items():
-                if zone_type != Zone.IN_PLAY: # IN_PLAY should use first_memory_instance_id
+                if zone_type is not Zone.IN_PLAY: # IN_PLAY should use first_memory_instance_id
                     for card_inst in card_list:
                         if card_inst.definition.card_id == active_player.first_memory_card_id:
                             # This assumes FM in hand/deck/discard is already an instance.
@@ -237,8 +293,9 @@ class GameState:
         self.add_log_entry(f"Created instance {instance.instance_id} for {card_def.name} for player {owner_id} in zone {initial_zone.name}")
         return instance
 
-    def move_card_zone(self, card_instance: CardInstance, new_zone_type: Zone, target_player_id: Optional[int] = None):
-        """Moves a CardInstance to a new zone."""
+    def move_card_zone(self, card_instance: CardInstance, new_zone_type: Zone, target_player_id: Optional[int] = None, from_index: Optional[int] = None):
+        """Moves a CardInstance to a new zone. Callers that already know the card's position
+        in its current zone list can pass from_index to skip the linear search on removal."""
         if target_player_id is None:
             target_player_id = card_instance.controller_id # Default to current controller for new zone
 
@@ -256,20 +313,32 @@ class GameState:
         old_zone_type = card_instance.current_zone
         old_zone_player_id = card_instance.controller_id # Assume card was in controller's zone
 
-        # Remove from old zone
-        if old_zone_type == Zone.IN_PLAY:
-            if card_instance.instance_id in self.cards_in_play:
-                del self.cards_in_play[card_instance.instance_id]
+        # Remove from old zone. Each container is touched once: pop()/remove() double as the
+        # membership test instead of an 'in' check followed by a second lookup/scan.
+        old_player_state = self.get_player_state(old_zone_player_id)
+        if old_zone_type is Zone.IN_PLAY:
+            self.cards_in_play.pop(card_instance.instance_id, None)
             # Also remove from the player's specific IN_PLAY list if they have one (current PlayerState.zones[Zone.IN_PLAY] is a bit redundant)
-            old_player_state_for_in_play = self.get_player_state(old_zone_player_id)
-            if old_player_state_for_in_play and card_instance in old_player_state_for_in_play.zones[Zone.IN_PLAY]:
-                 old_player_state_for_in_play.zones[Zone.IN_PLAY].remove(card_instance)
+            if old_player_state:
+                try:
+                    old_player_state.zones[Zone.IN_PLAY].remove(card_instance)
+                except ValueError:
+                    pass
 
         else: # Other zones are in PlayerState.zones
-            old_player_state = self.get_player_state(old_zone_player_id)
-            if old_player_state and card_instance in old_player_state.zones[old_zone_type]:
-                old_player_state.zones[old_zone_type].remove(card_instance)
-            else:
+            removed_from_old_zone = False
+            if old_player_state:
+                old_zone_list = old_player_state.zones[old_zone_type]
+                if from_index is not None and 0 <= from_index < len(old_zone_list) and old_zone_list[from_index] is card_instance:
+                    del old_zone_list[from_index]
+                    removed_from_old_zone = True
+                else:
+                    try:
+                        old_zone_list.remove(card_instance)
+                        removed_from_old_zone = True
+                    except ValueError:
+                        pass
+            if not removed_from_old_zone:
                 self.add_log_entry(f"Card {card_instance.instance_id} not found in player {old_zone_player_id}'s zone {old_zone_type.name} for removal.", "WARNING")
         
         # Update card's internal zone and controller if changing
@@ -277,11 +346,11 @@ class GameState:
         card_instance.controller_id = target_player_id # Controller might change with zone
 
         # Add to new zone
-        if new_zone_type == Zone.IN_PLAY:
+        if new_zone_type is Zone.IN_PLAY:
             self.cards_in_play[card_instance.instance_id] = card_instance
             # Also add to player's IN_PLAY list for consistency if PlayerState.zones[Zone.IN_PLAY] is used
             target_player_state.zones[Zone.IN_PLAY].append(card_instance)
-        elif new_zone_type in [Zone.DISCARD, Zone.EXILE] and new_zone_type in current_owner_state.zones:
+        elif new_zone_type in OWNER_ONLY_ZONES and new_zone_type in current_owner_state.zones:
             # Discard and Exile typically go to owner's zone
             card_instance.controller_id = card_instance.owner_id # Controller becomes owner
             current_owner_state.zones[new_zone_type].append(card_instance)
@@ -291,7 +360,8 @@ class GameState:
             self.add_log_entry(f"Target zone {new_zone_type.name} not recognized in PlayerState for player {target_player_id}.", "ERROR")
             return
 
-        self.add_log_entry(f"Moved {card_instance.definition.name} ({card_instance.instance_id}) from P{old_zone_player_id}'s {old_zone_type.name} to P{target_player_id}'s {new_zone_type.name}.")
+        if self.log_enabled: # Every zone change passes through here; skip the name/zone formatting when silent
+            self.add_log_entry(f"Moved {card_instance.definition.name} ({card_instance.instance_id}) from P{old_zone_player_id}'s {old_zone_type.name} to P{target_player_id}'s {new_zone_type.name}.")
         
         # TODO: Trigger zone change events
 
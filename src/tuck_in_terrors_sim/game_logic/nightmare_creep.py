@@ -116,7 +116,8 @@ class NightmareCreepModule:
         parsed_effect_object = self._parse_json_data_to_effect_object(effect_definition_data, current_turn)
 
         if parsed_effect_object:
-            gs.add_log_entry(f"Resolving Nightmare Creep effect: {parsed_effect_object.description or parsed_effect_object.effect_id}", level="DEBUG")
+            if gs.debug_log_enabled:
+                gs.add_log_entry(f"Resolving Nightmare Creep effect: {parsed_effect_object.description or parsed_effect_object.effect_id}", level="DEBUG")
             
             self.effect_engine.resolve_effect( # Calling the new method in EffectEngine
                 effect=parsed_effect_object,
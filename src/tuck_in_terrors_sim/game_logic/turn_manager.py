@@ -50,15 +50,20 @@ class TurnManager:
         gs.current_phase = TurnPhase.BEGIN_TURN
         gs.add_log_entry(f"Turn {gs.current_turn} - Begin Phase (Player {active_player.player_id}).")
 
+        # Bind hot attribute lookups once for the per-card loops below
+        log = gs.add_log_entry
+        cards_in_play = gs.cards_in_play
+        active_player_id = active_player.player_id
+
         # Untap cards
-        for card_instance in list(gs.cards_in_play.values()): # Iterate copy
-            if card_instance.controller_id == active_player.player_id and card_instance.is_tapped:
+        for card_instance in list(cards_in_play.values()): # Iterate copy
+            if card_instance.controller_id == active_player_id and card_instance.is_tapped:
                 card_instance.untap()
-                gs.add_log_entry(f"Untapped '{card_instance.definition.name}' ({card_instance.instance_id}).")
+                log(f"Untapped '{card_instance.definition.name}' ({card_instance.instance_id}).")
         
         # Clear once-per-turn effect usage trackers for cards controlled by the player
-        for card_instance in gs.cards_in_play.values():
-            if card_instance.controller_id == active_player.player_id:
+        for card_instance in cards_in_play.values():
+            if card_instance.controller_id == active_player_id:
                 # Ensure the attribute exists, similar to action_generator.py
                 if hasattr(card_instance, 'effects_active_this_turn'): # Ensure correct attribute name
                     card_instance.effects_active_this_turn.clear()
@@ -102,7 +107,8 @@ class TurnManager:
             gs.add_log_entry(f"Player {active_player.player_id} sets mana to {active_player.mana} (Turn {gs.current_turn} + {STANDARD_MANA_GAIN_PER_TURN_BASE}).")
         elif gs.current_turn == 1 and active_player.mana != (gs.current_turn + STANDARD_MANA_GAIN_PER_TURN_BASE) and is_first_turn_mana_override:
              # This log entry might be redundant if mana is correctly set as per override
-             gs.add_log_entry(f"Player {active_player.player_id} mana is {active_player.mana} for Turn 1 (objective override). Standard gain would have been {gs.current_turn + STANDARD_MANA_GAIN_PER_TURN_BASE}.", level="DEBUG")
+             if gs.debug_log_enabled:
+                 gs.add_log_entry(f"Player {active_player.player_id} mana is {active_player.mana} for Turn 1 (objective override). Standard gain would have been {gs.current_turn + STANDARD_MANA_GAIN_PER_TURN_BASE}.", level="DEBUG")
 
 
         # Draw card(s)
@@ -120,12 +126,13 @@ class TurnManager:
 
         # Resolve "at the beginning of turn" effects for cards in play (oldest first)
         if not gs.game_over:
-            gs.add_log_entry("Resolving 'at beginning of turn' effects for cards in play.", "EFFECT_DEBUG")
+            if gs.debug_log_enabled:
+                log("Resolving 'at beginning of turn' effects for cards in play.", "EFFECT_DEBUG")
             
             # Get cards controlled by the active player
             player_cards_in_play = [
-                card_inst for card_inst in gs.cards_in_play.values()
-                if card_inst.controller_id == active_player.player_id
+                card_inst for card_inst in cards_in_play.values()
+                if card_inst.controller_id == active_player_id
             ]
 
             # Sort them: oldest first (by turn_entered_play, then by instance_id for tie-breaking)
@@ -137,17 +144,23 @@ class TurnManager:
 
             player_cards_in_play.sort(key=sort_key)
 
+            resolve_effect = self.effect_engine.resolve_effect
+            at_beginning_of_turn = EffectTriggerType.AT_BEGINNING_OF_TURN
+            # One context object is shared by every effect resolved below; effects only read it and must not write to it
+            begin_turn_event_context = {'event_type': at_beginning_of_turn.name, 'turn': gs.current_turn}
+
             for card_instance in player_cards_in_play: # type: ignore
                 if gs.game_over: break # Stop if an effect ends the game
                 for effect_obj in card_instance.definition.effects: # type: ignore
-                    if effect_obj.trigger == EffectTriggerType.AT_BEGINNING_OF_TURN:
-                        gs.add_log_entry(f"Attempting AT_BEGINNING_OF_TURN effect for '{card_instance.definition.name}' ({card_instance.instance_id}).", "EFFECT_DEBUG") # type: ignore
-                        self.effect_engine.resolve_effect(
+                    if effect_obj.trigger is at_beginning_of_turn:
+                        if gs.debug_log_enabled:
+                            log(f"Attempting AT_BEGINNING_OF_TURN effect for '{card_instance.definition.name}' ({card_instance.instance_id}).", "EFFECT_DEBUG") # type: ignore
+                        resolve_effect(
                             effect=effect_obj,
                             game_state=gs,
                             player=active_player, # The player whose turn it is
                             source_card_instance=card_instance, # type: ignore
-                            triggering_event_context={'event_type': EffectTriggerType.AT_BEGINNING_OF_TURN.name, 'turn': gs.current_turn}
+                            triggering_event_context=begin_turn_event_context
                         )
                         if gs.game_over: break
                 if gs.game_over: break
@@ -177,10 +190,12 @@ class TurnManager:
             chosen_game_action = ai_agent.decide_action(gs, possible_actions)
 
             if not chosen_game_action or chosen_game_action.type == "PASS_TURN":
-                gs.add_log_entry(f"Player {active_player.player_id} chose to PASS turn or no action taken.")
+                if gs.log_enabled:
+                    gs.add_log_entry(f"Player {active_player.player_id} chose to PASS turn or no action taken.")
                 break 
             
-            gs.add_log_entry(f"Player {active_player.player_id} attempts action: {chosen_game_action.type} - {chosen_game_action.description}", level="ACTION")
+            if gs.log_enabled: # Once per AI action; skip formatting when the log is discarded
+                gs.add_log_entry(f"Player {active_player.player_id} attempts action: {chosen_game_action.type} - {chosen_game_action.description}", level="ACTION")
             
             # Resolve the chosen action using ActionResolver
             success = False
@@ -198,9 +213,11 @@ class TurnManager:
                 )
             
             if success:
-                gs.add_log_entry(f"Action {chosen_game_action.type} resolved successfully.", "ACTION_SUCCESS")
+                if gs.log_enabled:
+                    gs.add_log_entry(f"Action {chosen_game_action.type} resolved successfully.", "ACTION_SUCCESS")
             else:
-                gs.add_log_entry(f"Action {chosen_game_action.type} FAILED to resolve.", "ACTION_FAIL")
+                if gs.log_enabled:
+                    gs.add_log_entry(f"Action {chosen_game_action.type} FAILED to resolve.", "ACTION_FAIL")
                 # If an action fails, AI might loop; consider breaking or different AI logic
                 # For now, we continue to see if AI tries something else or passes.
 
@@ -249,9 +266,10 @@ class TurnManager:
                 # else: # Fallback if AI choice fails or is not implemented
                 
                 # Fallback: random discard
-                discard_idx = random.randrange(len(active_player.zones[Zone.HAND]))
-                discarded_instance = active_player.zones[Zone.HAND].pop(discard_idx)
-                gs.move_card_zone(discarded_instance, Zone.DISCARD, active_player.player_id) # This handles logging
+                discard_idx = (gs.rng or random).randrange(len(active_player.zones[Zone.HAND]))
+                discarded_instance = active_player.zones[Zone.HAND][discard_idx]
+                # Hand removal happens by index inside move_card_zone, no search of the hand needed
+                gs.move_card_zone(discarded_instance, Zone.DISCARD, active_player.player_id, from_index=discard_idx) # This handles logging
                 gs.add_log_entry(f"Player {active_player.player_id} discarded '{discarded_instance.definition.name}' due to hand size.")
                 # Trigger ON_DISCARD_THIS_CARD for the discarded_instance.definition
                 # for effect_obj in discarded_instance.definition.effects:
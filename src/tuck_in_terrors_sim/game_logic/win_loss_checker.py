@@ -55,7 +55,8 @@ class WinLossChecker:
         params = win_con.params
         condition_met = False
 
-        gs.add_log_entry(f"Checking win condition: {component_type} with params {params}", level="DEBUG")
+        if gs.debug_log_enabled:
+            gs.add_log_entry(f"Checking win condition: {component_type} with params {params}", level="DEBUG")
 
         # Implement logic for different component_types based on your objectives.json examples
         if component_type == "PLAY_X_DIFFERENT_TOYS_AND_CREATE_Y_SPIRITS":
@@ -66,10 +67,11 @@ class WinLossChecker:
             spirits_needed = params.get("spirits_needed", 0)
             
             # Ensure objective_progress has these keys, initialized by game_setup or updated by game logic
-            distinct_toys_played_count = len(gs.objective_progress.get("distinct_toys_played_ids", set()))
+            distinct_toys_played_count = len(gs.objective_progress.get("distinct_toys_played_ids", ()))
             total_spirits_created = gs.objective_progress.get("spirits_created_total_game", 0)
             
-            gs.add_log_entry(f"  PLAY_X_DIFFERENT_TOYS_AND_CREATE_Y_SPIRITS check: Played {distinct_toys_played_count}/{toys_needed} distinct toys, Created {total_spirits_created}/{spirits_needed} spirits.", level="DEBUG")
+            if gs.debug_log_enabled:
+                gs.add_log_entry(f"  PLAY_X_DIFFERENT_TOYS_AND_CREATE_Y_SPIRITS check: Played {distinct_toys_played_count}/{toys_needed} distinct toys, Created {total_spirits_created}/{spirits_needed} spirits.", level="DEBUG")
             if distinct_toys_played_count >= toys_needed and total_spirits_created >= spirits_needed:
                 condition_met = True
 
@@ -79,7 +81,8 @@ class WinLossChecker:
             mana_needed = params.get("mana_needed", 0)
             total_mana_from_effects = gs.objective_progress.get("mana_from_card_effects_total_game", 0)
             
-            gs.add_log_entry(f"  GENERATE_X_MANA_FROM_CARD_EFFECTS check: Generated {total_mana_from_effects}/{mana_needed} mana from effects.", level="DEBUG")
+            if gs.debug_log_enabled:
+                gs.add_log_entry(f"  GENERATE_X_MANA_FROM_CARD_EFFECTS check: Generated {total_mana_from_effects}/{mana_needed} mana from effects.", level="DEBUG")
             if total_mana_from_effects >= mana_needed:
                 condition_met = True
         
@@ -97,10 +100,12 @@ class WinLossChecker:
             # Let's assume a structure like: objective_progress["CAST_SPELL_EVENT_MET"][spell_id_or_name] = True
             event_key = f"CAST_SPELL_EVENT_MET_{spell_id_or_name}_STORM_{min_storm}"
             if gs.objective_progress.get(event_key, False):
-                gs.add_log_entry(f"  CAST_SPELL_WITH_STORM_COUNT check: Event for {spell_id_or_name} with storm >={min_storm} MET.", level="DEBUG")
+                if gs.debug_log_enabled:
+                    gs.add_log_entry(f"  CAST_SPELL_WITH_STORM_COUNT check: Event for {spell_id_or_name} with storm >={min_storm} MET.", level="DEBUG")
                 condition_met = True
             else:
-                gs.add_log_entry(f"  CAST_SPELL_WITH_STORM_COUNT check: Event for {spell_id_or_name} with storm >={min_storm} NOT YET MET.", level="DEBUG")
+                if gs.debug_log_enabled:
+                    gs.add_log_entry(f"  CAST_SPELL_WITH_STORM_COUNT check: Event for {spell_id_or_name} with storm >={min_storm} NOT YET MET.", level="DEBUG")
 
 
         elif component_type == "CREATE_TOTAL_X_SPIRITS_GAME":
@@ -109,7 +114,8 @@ class WinLossChecker:
             spirits_needed = params.get("spirits_needed", 0)
             total_spirits_created = gs.objective_progress.get("spirits_created_total_game", 0)
 
-            gs.add_log_entry(f"  CREATE_TOTAL_X_SPIRITS_GAME check: Created {total_spirits_created}/{spirits_needed} total spirits.", level="DEBUG")
+            if gs.debug_log_enabled:
+                gs.add_log_entry(f"  CREATE_TOTAL_X_SPIRITS_GAME check: Created {total_spirits_created}/{spirits_needed} total spirits.", level="DEBUG")
             if total_spirits_created >= spirits_needed:
                 condition_met = True
 
@@ -119,7 +125,8 @@ class WinLossChecker:
             active_player = gs.get_active_player_state()
             current_spirits = active_player.spirit_tokens if active_player else 0
 
-            gs.add_log_entry(f"  CONTROL_X_SPIRITS_AT_ONCE check: Have {current_spirits}/{spirits_needed} spirits.", level="DEBUG")
+            if gs.debug_log_enabled:
+                gs.add_log_entry(f"  CONTROL_X_SPIRITS_AT_ONCE check: Have {current_spirits}/{spirits_needed} spirits.", level="DEBUG")
             if current_spirits >= spirits_needed:
                 condition_met = True
 
@@ -128,7 +135,8 @@ class WinLossChecker:
             cards_needed = params.get("cards_needed", 0)
             spirit_generating_cards = gs.objective_progress.get("spirit_generating_cards_in_play", set())
 
-            gs.add_log_entry(f"  CONTROL_X_DIFFERENT_SPIRIT_GENERATING_CARDS_IN_PLAY check: Have {len(spirit_generating_cards)}/{cards_needed} cards.", level="DEBUG")
+            if gs.debug_log_enabled:
+                gs.add_log_entry(f"  CONTROL_X_DIFFERENT_SPIRIT_GENERATING_CARDS_IN_PLAY check: Have {len(spirit_generating_cards)}/{cards_needed} cards.", level="DEBUG")
             if len(spirit_generating_cards) >= cards_needed:
                 condition_met = True
 
@@ -137,7 +145,8 @@ class WinLossChecker:
             loops_needed = params.get("toy_loops_needed", 0)
             max_loops_this_turn = gs.objective_progress.get("max_toy_loops_this_turn", 0)
 
-            gs.add_log_entry(f"  LOOP_TOY_X_TIMES_IN_TURN check: Max loops this turn {max_loops_this_turn}/{loops_needed}.", level="DEBUG")
+            if gs.debug_log_enabled:
+                gs.add_log_entry(f"  LOOP_TOY_X_TIMES_IN_TURN check: Max loops this turn {max_loops_this_turn}/{loops_needed}.", level="DEBUG")
             if max_loops_this_turn >= loops_needed:
                 condition_met = True
 
@@ -146,7 +155,8 @@ class WinLossChecker:
             toys_needed = params.get("toys_needed", 0)
             toys_returned = gs.objective_progress.get("different_toys_returned_from_discard", set())
 
-            gs.add_log_entry(f"  RETURN_X_DIFFERENT_TOYS_FROM_DISCARD_TO_HAND_GAME check: Returned {len(toys_returned)}/{toys_needed} toys.", level="DEBUG")
+            if gs.debug_log_enabled:
+                gs.add_log_entry(f"  RETURN_X_DIFFERENT_TOYS_FROM_DISCARD_TO_HAND_GAME check: Returned {len(toys_returned)}/{toys_needed} toys.", level="DEBUG")
             if len(toys_returned) >= toys_needed:
                 condition_met = True
 
@@ -155,7 +165,8 @@ class WinLossChecker:
             reanimations_needed = params.get("reanimations_needed", 0)
             fm_reanimations = gs.objective_progress.get("first_memory_reanimations", 0)
 
-            gs.add_log_entry(f"  REANIMATE_FIRST_MEMORY_X_TIMES check: Reanimated FM {fm_reanimations}/{reanimations_needed} times.", level="DEBUG")
+            if gs.debug_log_enabled:
+                gs.add_log_entry(f"  REANIMATE_FIRST_MEMORY_X_TIMES check: Reanimated FM {fm_reanimations}/{reanimations_needed} times.", level="DEBUG")
             if fm_reanimations >= reanimations_needed:
                 condition_met = True
 
@@ -164,7 +175,8 @@ class WinLossChecker:
             toys_needed = params.get("toys_needed", 0)
             toys_reanimated = gs.objective_progress.get("different_toys_reanimated", set())
 
-            gs.add_log_entry(f"  REANIMATE_X_DIFFERENT_TOYS_GAME check: Reanimated {len(toys_reanimated)}/{toys_needed} different toys.", level="DEBUG")
+            if gs.debug_log_enabled:
+                gs.add_log_entry(f"  REANIMATE_X_DIFFERENT_TOYS_GAME check: Reanimated {len(toys_reanimated)}/{toys_needed} different toys.", level="DEBUG")
             if len(toys_reanimated) >= toys_needed:
                 condition_met = True
 
@@ -173,7 +185,8 @@ class WinLossChecker:
             spells_needed = params.get("spells_needed", 0)
             spells_this_turn = gs.objective_progress.get("different_spells_cast_this_turn", set())
 
-            gs.add_log_entry(f"  CAST_X_DIFFERENT_NON_TOY_SPELLS_IN_TURN check: Cast {len(spells_this_turn)}/{spells_needed} spells this turn.", level="DEBUG")
+            if gs.debug_log_enabled:
+                gs.add_log_entry(f"  CAST_X_DIFFERENT_NON_TOY_SPELLS_IN_TURN check: Cast {len(spells_this_turn)}/{spells_needed} spells this turn.", level="DEBUG")
             if len(spells_this_turn) >= spells_needed:
                 condition_met = True
 
@@ -182,7 +195,8 @@ class WinLossChecker:
             spells_needed = params.get("spells_needed", 0)
             spells_played = gs.objective_progress.get("different_spells_played_game", set())
 
-            gs.add_log_entry(f"  PLAY_X_DIFFERENT_NON_TOY_SPELLS_GAME check: Played {len(spells_played)}/{spells_needed} different spells.", level="DEBUG")
+            if gs.debug_log_enabled:
+                gs.add_log_entry(f"  PLAY_X_DIFFERENT_NON_TOY_SPELLS_GAME check: Played {len(spells_played)}/{spells_needed} different spells.", level="DEBUG")
             if len(spells_played) >= spells_needed:
                 condition_met = True
 
@@ -197,13 +211,14 @@ class WinLossChecker:
 
                 from ..game_elements.enums import CardType
                 toys_in_play = sum(1 for card in gs.cards_in_play.values()
-                                  if card.definition.type == CardType.TOY
+                                  if card.definition.type is CardType.TOY
                                   and card.controller_id == active_player.player_id)
                 rituals_in_play = sum(1 for card in gs.cards_in_play.values()
-                                     if card.definition.type == CardType.RITUAL
+                                     if card.definition.type is CardType.RITUAL
                                      and card.controller_id == active_player.player_id)
 
-                gs.add_log_entry(f"  EMPTY_DECK_WITH_CARDS_IN_PLAY check: Deck empty={deck_empty}, Toys={toys_in_play}/{min_toys}, Rituals={rituals_in_play}/{min_rituals}.", level="DEBUG")
+                if gs.debug_log_enabled:
+                    gs.add_log_entry(f"  EMPTY_DECK_WITH_CARDS_IN_PLAY check: Deck empty={deck_empty}, Toys={toys_in_play}/{min_toys}, Rituals={rituals_in_play}/{min_rituals}.", level="DEBUG")
                 if deck_empty and toys_in_play >= min_toys and rituals_in_play >= min_rituals:
                     condition_met = True
 
@@ -212,7 +227,8 @@ class WinLossChecker:
             toys_needed = params.get("toys_needed", 0)
             toys_sacrificed = gs.objective_progress.get("toys_sacrificed_game", 0)
 
-            gs.add_log_entry(f"  SACRIFICE_X_TOYS_GAME check: Sacrificed {toys_sacrificed}/{toys_needed} toys.", level="DEBUG")
+            if gs.debug_log_enabled:
+                gs.add_log_entry(f"  SACRIFICE_X_TOYS_GAME check: Sacrificed {toys_sacrificed}/{toys_needed} toys.", level="DEBUG")
             if toys_sacrificed >= toys_needed:
                 condition_met = True
 
@@ -229,7 +245,8 @@ class WinLossChecker:
             if params.get("memory_tokens_spent_count", False):
                 memory_tokens += gs.objective_progress.get("memory_tokens_spent_game", 0)
 
-            gs.add_log_entry(f"  ROLL_TOTAL_X_ON_CARD_AND_HAVE_Y_MEMORY_TOKENS check: Rolls={total_rolls}/{total_roll_needed}, Memory={memory_tokens}/{memory_tokens_needed}.", level="DEBUG")
+            if gs.debug_log_enabled:
+                gs.add_log_entry(f"  ROLL_TOTAL_X_ON_CARD_AND_HAVE_Y_MEMORY_TOKENS check: Rolls={total_rolls}/{total_roll_needed}, Memory={memory_tokens}/{memory_tokens_needed}.", level="DEBUG")
             if total_rolls >= total_roll_needed and memory_tokens >= memory_tokens_needed:
                 condition_met = True
 
@@ -238,7 +255,8 @@ class WinLossChecker:
             cards_needed = params.get("cards_needed", 0)
             cards_played = gs.objective_progress.get("cards_played_from_exile", 0)
 
-            gs.add_log_entry(f"  PLAY_X_CARDS_FROM_EXILE_GAME check: Played {cards_played}/{cards_needed} cards from exile.", level="DEBUG")
+            if gs.debug_log_enabled:
+                gs.add_log_entry(f"  PLAY_X_CARDS_FROM_EXILE_GAME check: Played {cards_played}/{cards_needed} cards from exile.", level="DEBUG")
             if cards_played >= cards_needed:
                 condition_met = True
 
@@ -22,7 +22,7 @@ class DataLogger:
         
         # Extract specific progress metrics for easier analysis
         progress = final_state.objective_progress
-        distinct_toys_played = len(progress.get("distinct_toys_played_ids", set()))
+        distinct_toys_played = len(progress.get("distinct_toys_played_ids", ()))
         spirits_created = progress.get("spirits_created_total_game", 0)
         mana_from_effects = progress.get("mana_from_card_effects_total_game", 0)
 
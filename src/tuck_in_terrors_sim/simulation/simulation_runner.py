@@ -1,6 +1,7 @@
 # src/tuck_in_terrors_sim/simulation/simulation_runner.py
 
 import copy
+import random
 from typing import Optional, Tuple, List
 
 # Game data and elements
@@ -41,15 +42,18 @@ class SimulationRunner:
             print(f"Warning: Unknown AI profile '{ai_profile_name}'.")
             return None
 
-    def run_one_game(self, objective_id: str, ai_profile_name: str, detailed_logging: bool = False) -> Tuple[Optional[GameState], List[GameState]]:
+    def run_one_game(self, objective_id: str, ai_profile_name: str, detailed_logging: bool = False,
+                     rng: Optional[random.Random] = None) -> Tuple[Optional[GameState], List[GameState]]:
         """
         Runs a single complete game simulation from setup to a win/loss condition.
+        Pass a seeded random.Random as rng to make the game's shuffles reproducible independently of other games.
         """
         objective = self.game_data.get_objective_by_id(objective_id)
         if not objective:
             return None, []
 
-        game_state = initialize_new_game(objective, self.game_data.cards_by_id)
+        # Only detailed runs surface the game flow, so plain statistical runs keep just errors and warnings
+        game_state = initialize_new_game(objective, self.game_data.cards_by_id, silent_logging=not detailed_logging, rng=rng)
         game_snapshots: List[GameState] = []
 
         ai_player = self._get_ai_profile(ai_profile_name, DEFAULT_PLAYER_ID)
@@ -74,7 +78,7 @@ class SimulationRunner:
             cards_starting_in_play = list(active_player_state.zones[Zone.IN_PLAY])
             for card_instance in cards_starting_in_play:
                 for effect in card_instance.definition.effects:
-                    if effect.trigger == EffectTriggerType.ON_PLAY:
+                    if effect.trigger is EffectTriggerType.ON_PLAY:
                         effect_engine.resolve_effect(
                             effect=effect, game_state=game_state, player=active_player_state,
                             source_card_instance=card_instance
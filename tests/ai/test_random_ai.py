@@ -15,6 +15,7 @@ from tuck_in_terrors_sim.game_logic.game_setup import DEFAULT_PLAYER_ID
 @pytest.fixture
 def mock_game_state_for_ai() -> GameState: # Renamed to avoid conflict
     gs_mock = MagicMock(spec=GameState)
+    gs_mock.debug_log_enabled = True # Instance attribute, so not covered by the class spec
     
     player_state_mock = MagicMock(spec=PlayerState)
     player_state_mock.player_id = DEFAULT_PLAYER_ID
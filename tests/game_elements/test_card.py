@@ -3,11 +3,11 @@ import pytest
 from typing import Dict, List, Any, Optional
 
 from tuck_in_terrors_sim.game_elements.card import (
-    Card, Toy, Spell, Ritual, Effect, EffectAction, Cost, CardInstance
+    Card, Toy, Spell, Ritual, Effect, EffectAction, EffectCondition, Cost, CardInstance
 )
 from tuck_in_terrors_sim.game_elements.enums import (
     CardType, CardSubType, EffectTriggerType, EffectActionType, Zone,
-    EffectConditionType, ResourceType, EffectActivationCostType
+    EffectConditionType, ResourceType, EffectActivationCostType, PlayerChoiceType
 )
 
 # --- Test Fixtures / Mock Data ---
@@ -102,6 +102,23 @@ class TestEffectAction:
         assert action.params["amount"] == 5
         assert action.description == "Gain mana."
 
+    def test_common_params_are_extracted(self):
+        action = EffectAction(action_type=EffectActionType.PLACE_COUNTER_ON_CARD, params={"amount": 2, "counter_type": "STUDY"})
+        assert action.amount == 2
+        assert action.counter_type == "STUDY"
+        assert action.count == 1 # Defaults match what the handlers assumed
+        assert action.from_zone is None and action.to_zone is None
+        move = EffectAction(action_type=EffectActionType.RETURN_CARD_FROM_ZONE_TO_ZONE, params={"from_zone": Zone.DISCARD, "to_zone": Zone.HAND})
+        assert move.from_zone is Zone.DISCARD and move.to_zone is Zone.HAND
+
+    def test_player_choice_prebuilds_ai_context(self):
+        yes_action = EffectAction(action_type=EffectActionType.ADD_MANA, params={"amount": 1})
+        action = EffectAction(action_type=EffectActionType.PLAYER_CHOICE,
+                              params={"choice_type": PlayerChoiceType.CHOOSE_YES_NO, "prompt_text": "Gain mana?",
+                                      "on_yes_actions": [yes_action], "on_no_actions": []})
+        assert action.choice_context == {"choice_type": PlayerChoiceType.CHOOSE_YES_NO, "prompt_text": "Gain mana?", "options": None}
+        assert yes_action.choice_context is None
+
     def test_to_dict_with_enum_in_params(self):
         action = EffectAction(
             action_type=EffectActionType.PLACE_COUNTER_ON_CARD, 
@@ -123,7 +140,7 @@ class TestEffect:
         assert effect.actions[0].action_type == EffectActionType.DRAW_CARDS
 
     def test_creation_full(self, minimal_effect_action: EffectAction, complex_cost: Cost):
-        condition = {EffectConditionType.PLAYER_HAS_RESOURCE: {"resource_type": ResourceType.SPIRIT_TOKENS, "amount": 1}}
+        condition = EffectCondition(EffectConditionType.PLAYER_HAS_RESOURCE, {"resource_type": ResourceType.SPIRIT_TOKENS, "amount": 1})
         effect = Effect(
             effect_id="E002",
             trigger=EffectTriggerType.ACTIVATED_ABILITY,
@@ -137,10 +154,11 @@ class TestEffect:
         assert effect.description == "Complex effect"
         assert effect.cost == complex_cost 
         assert effect.is_replacement_effect is True
-        assert effect.condition[EffectConditionType.PLAYER_HAS_RESOURCE]["resource_type"] == ResourceType.SPIRIT_TOKENS
+        assert effect.condition.condition_type == EffectConditionType.PLAYER_HAS_RESOURCE
+        assert effect.condition.params["resource_type"] == ResourceType.SPIRIT_TOKENS
 
     def test_to_dict(self, minimal_effect_action, complex_cost):
-        condition = {EffectConditionType.PLAYER_HAS_RESOURCE: {"resource_type": ResourceType.MANA, "amount": 3}}
+        condition = EffectCondition(EffectConditionType.PLAYER_HAS_RESOURCE, {"resource_type": ResourceType.MANA, "amount": 3})
         effect = Effect(
             effect_id="E_DICT",
             trigger=EffectTriggerType.ACTIVATED_ABILITY,
@@ -153,6 +171,7 @@ class TestEffect:
         effect_dict = effect.to_dict()
         assert effect_dict["effect_id"] == "E_DICT"
         assert effect_dict["cost"] is not None
+        assert effect_dict["condition"] == {"condition_type": "PLAYER_HAS_RESOURCE", "params": {"resource_type": "MANA", "amount": 3}}
 
 
 # --- Tests for Card Classes (Card, Toy, Spell, Ritual) ---
@@ -220,6 +239,7 @@ class TestCardInstance:
         assert instance.turns_in_play == 0
         assert instance.turn_entered_play is None
         assert instance.custom_data == {}
+        assert not hasattr(instance, "__dict__") # Slotted; a typo'd attribute name fails loudly
 
     def test_tap_untap(self, toy_card_data: Dict[str, Any]):
         instance = CardInstance(Toy(**toy_card_data), 0, Zone.IN_PLAY)
@@ -233,7 +253,7 @@ class TestCardInstance:
         instance = CardInstance(Toy(**toy_card_data), 0, Zone.IN_PLAY)
         instance.add_counter("test_counter", 2)
         assert instance.counters["test_counter"] == 2
-        instance.add_counter("test_counter", 1)
+        assert instance.add_counter("test_counter", 1) == 3
         assert instance.counters["test_counter"] == 3
         instance.remove_counter("test_counter", 1)
         assert instance.counters["test_counter"] == 2
@@ -8,7 +8,8 @@ from tuck_in_terrors_sim.game_elements.card import Card, Toy, Spell, Ritual, Eff
 from tuck_in_terrors_sim.game_elements.objective import ObjectiveCard, ObjectiveLogicComponent
 from tuck_in_terrors_sim.game_elements.enums import (
     CardType, CardSubType, EffectTriggerType, EffectActionType,
-    EffectConditionType, ResourceType, Zone, EffectActivationCostType, PlayerChoiceType
+    EffectConditionType, ResourceType, Zone, EffectActivationCostType, PlayerChoiceType,
+    TargetReference
 )
 from tuck_in_terrors_sim.game_elements.data_loaders import (
     load_cards,
@@ -148,6 +149,21 @@ class TestDataLoaders:
         assert len(parsed_action.params["on_true_actions"]) == 1
         assert parsed_action.params["on_true_actions"][0].action_type == EffectActionType.DRAW_CARDS
 
+        choice_action = _parse_effect_action({
+            "action_type": "PLAYER_CHOICE",
+            "params": {"choice_type": "CHOOSE_YES_NO", "on_yes_actions": [{"action_type": "CREATE_MEMORY_TOKENS", "params": {"count": 1}}]}
+        })
+        assert isinstance(choice_action.params["on_yes_actions"][0], EffectAction)
+
+    def test_parse_effect_action_resolves_self_target(self):
+        action_data = {
+            "action_type": "PLACE_COUNTER_ON_CARD",
+            "params": {"target_card_instance_id": "SELF", "counter_type": "FEEDING", "amount": 1}
+        }
+        parsed_action = _parse_effect_action(action_data)
+        assert parsed_action.params["target_card_instance_id"] is TargetReference.SELF
+        assert parsed_action.to_dict()["params"]["target_card_instance_id"] == "SELF"
+
     def test_load_objectives_success(self, tmp_path):
         p = tmp_path / "objectives_test.json"
         p.write_text(VALID_OBJECTIVES_JSON_CONTENT)
@@ -219,13 +235,18 @@ class TestDataLoaders:
             _parse_cost({"cost_type": "UNKNOWN_COST", "params": {}})
 
 
+    def test_parse_condition_resolves_enum_params(self):
+        cond = _parse_condition({"condition_type": "PLAYER_HAS_RESOURCE", "params": {"resource_type": "spirit_tokens", "amount": 2}})
+        assert cond.params["resource_type"] is ResourceType.SPIRIT_TOKENS
+        action = _parse_effect_action({"action_type": "PLAYER_CHOICE", "params": {"choice_type": "CHOOSE_YES_NO"}})
+        assert action.params["choice_type"] is PlayerChoiceType.CHOOSE_YES_NO
+
     def test_parse_condition_various(self):
         if not hasattr(EffectConditionType, "PLAYER_HAS_MANA_GE"):
             pytest.skip("Test requires EffectConditionType.PLAYER_HAS_MANA_GE")
         cond = _parse_condition({"condition_type": "PLAYER_HAS_MANA_GE", "params": {"amount": 5, "value": 5}})
-        assert EffectConditionType.PLAYER_HAS_MANA_GE in cond
-        assert cond[EffectConditionType.PLAYER_HAS_MANA_GE].get("amount") == 5 or \
-               cond[EffectConditionType.PLAYER_HAS_MANA_GE].get("value") == 5
+        assert cond.condition_type == EffectConditionType.PLAYER_HAS_MANA_GE
+        assert cond.params.get("amount") == 5 or cond.params.get("value") == 5
 
         assert _parse_condition(None) is None
         with pytest.raises(ValueError, match="Unknown EffectConditionType"):
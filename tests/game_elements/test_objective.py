@@ -103,6 +103,11 @@ class TestObjectiveCard:
         assert obj.card_rotation["featured_card_ids"][0] == "TCTOY001"
         assert obj.special_rules_text[0] == "LIMIT/TWIST: None"
 
+    def test_objective_banned_card_ids_prebuilt(self):
+        obj = ObjectiveCard(objective_id="OBJ_T", title="T", difficulty="Easy", card_rotation={"banned": ["TCTOY001"]})
+        assert obj.banned_card_ids == frozenset({"TCTOY001"})
+        assert ObjectiveCard(objective_id="OBJ_U", title="U", difficulty="Easy").banned_card_ids == frozenset()
+
     def test_objective_to_dict_consistency(self):
         original_obj = ObjectiveCard.from_dict(FIRST_NIGHT_OBJECTIVE_DATA)
         obj_dict = original_obj.to_dict()
@@ -121,6 +121,7 @@ class TestActionResolverPlayCard:
         # This assumes toy1_def.effects[0] is the ON_PLAY effect
         expected_event_context = {
             'event_type': 'CARD_PLAYED',
+            'event_subject': toy_instance,
             'played_card_instance_id': toy_instance.instance_id,
             'played_card_definition_id': toy_card_def.card_id,
             'played_card_type': toy_card_def.type,
@@ -156,6 +157,7 @@ class TestActionResolverPlayCard:
         assert player.mana == 1 
         expected_event_context_spell = {
             'event_type': 'CARD_PLAYED',
+            'event_subject': spell_instance,
             'played_card_instance_id': spell_instance.instance_id,
             'played_card_definition_id': spell_card_def.card_id,
             'played_card_type': spell_card_def.type,
@@ -234,6 +236,7 @@ class TestActionResolverPlayCard:
         
         expected_event_context = {
             'event_type': 'ABILITY_ACTIVATED',
+            'event_subject': act_toy_inst,
             'source_card_instance_id': act_toy_inst.instance_id,
             'source_card_definition_id': act_toy_def.card_id,
             'activated_effect_id': act_toy_def.effects[0].effect_id,
@@ -268,6 +271,7 @@ class TestActionResolverPlayCard:
         # Verify the effect was called with the correct context
         expected_event_context = {
             'event_type': 'ABILITY_ACTIVATED',
+            'event_subject': act_toy_inst,
             'source_card_instance_id': act_toy_inst.instance_id,
             'source_card_definition_id': act_toy_def.card_id,
             'activated_effect_id': act_toy_def.effects[1].effect_id,
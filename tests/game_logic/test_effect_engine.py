@@ -8,10 +8,11 @@ from unittest.mock import MagicMock, call
 # Game logic & elements
 from tuck_in_terrors_sim.game_logic.game_state import GameState, PlayerState
 from tuck_in_terrors_sim.game_logic.effect_engine import EffectEngine
-from tuck_in_terrors_sim.game_elements.card import Card, Effect, EffectAction, Toy, Spell, CardInstance, Cost 
+from tuck_in_terrors_sim.game_elements.card import Card, Effect, EffectAction, EffectCondition, Toy, Spell, CardInstance, Cost 
 from tuck_in_terrors_sim.game_elements.objective import ObjectiveCard
 from tuck_in_terrors_sim.game_elements.enums import (
-    EffectConditionType, EffectActionType, CardType, Zone, EffectTriggerType, PlayerChoiceType, ResourceType
+    EffectConditionType, EffectActionType, CardType, Zone, EffectTriggerType, PlayerChoiceType, ResourceType,
+    TargetReference
 )
 from tuck_in_terrors_sim.ai.ai_profiles.random_ai import RandomAI 
 from tuck_in_terrors_sim.game_logic.game_setup import DEFAULT_PLAYER_ID
@@ -84,8 +85,8 @@ def effect_engine_instance(game_state_with_player: GameState) -> EffectEngine:
     win_loss_checker = WinLossChecker(game_state=game_state_with_player) # Create WinLossChecker
     return EffectEngine(game_state_ref=game_state_with_player, win_loss_checker=win_loss_checker) # Pass it here
 
-def create_condition_data(condition_type: EffectConditionType, params: Dict[str, Any]) -> Dict[EffectConditionType, Any]:
-    return {condition_type: params}
+def create_condition_data(condition_type: EffectConditionType, params: Dict[str, Any]) -> EffectCondition:
+    return EffectCondition(condition_type, params)
 
 
 class TestEffectEngineConditions:
@@ -104,6 +105,7 @@ class TestEffectEngineConditions:
 
         condition = create_condition_data(EffectConditionType.IS_FIRST_MEMORY_IN_PLAY, {})
         assert ee.check_condition(condition, player, None, gs) is True
+        assert ee.check_condition(create_condition_data(EffectConditionType.IS_FIRST_MEMORY_IN_DISCARD, {}), player, None, gs) is False
 
 # tests/game_logic/test_effect_engine.py
 # Replace the failing test method with this one inside the TestEffectEngineConditions class
@@ -129,13 +131,26 @@ class TestEffectEngineConditions:
             del gs.cards_in_play[first_memory_inst.instance_id]
 
         # Define the condition we want to test
-        condition = {EffectConditionType.IS_FIRST_MEMORY_IN_DISCARD: {}}
+        condition = EffectCondition(EffectConditionType.IS_FIRST_MEMORY_IN_DISCARD)
         
         # Act
         result = effect_engine_instance.check_condition(condition, player, None, gs)
         
         # Assert
         assert result is True, "Should correctly identify the First Memory when it is in the discard pile"
+
+    def test_check_condition_player_has_resource(self, effect_engine_instance: EffectEngine, game_state_with_player: GameState):
+        ee = effect_engine_instance
+        gs = game_state_with_player
+        player = gs.get_active_player_state()
+        assert player is not None
+        player.mana = 3
+        player.memory_tokens = 0
+
+        assert ee.check_condition(create_condition_data(EffectConditionType.PLAYER_HAS_RESOURCE, {"resource_type": ResourceType.MANA, "amount": 3}), player, None, gs) is True
+        assert ee.check_condition(create_condition_data(EffectConditionType.PLAYER_HAS_RESOURCE, {"resource_type": ResourceType.MEMORY_TOKENS, "amount": 1}), player, None, gs) is False
+        assert ee.check_condition(create_condition_data(EffectConditionType.PLAYER_HAS_RESOURCE, {"resource_type": ResourceType.PLAYER_HEALTH}), player, None, gs) is False
+
     def test_check_condition_no_condition(self, effect_engine_instance: EffectEngine, game_state_with_player: GameState):
         ee = effect_engine_instance
         player = game_state_with_player.get_active_player_state()
@@ -157,6 +172,23 @@ class TestEffectEngineConditions:
         condition = create_condition_data(EffectConditionType.HAS_COUNTER_TYPE_VALUE_GE, {"counter_type": "power", "value": 3}) # Changed from "amount" to "value"
         assert ee.check_condition(condition, player, card_inst, gs) is True
 
+    def test_check_condition_event_card_is_type_reads_event_subject(self, effect_engine_instance: EffectEngine, game_state_with_player: GameState, card_defs_for_ee: Dict[str, Card]):
+        ee = effect_engine_instance
+        gs = game_state_with_player
+        player = gs.get_active_player_state()
+        assert player is not None
+
+        spell_inst = CardInstance(definition=card_defs_for_ee["S_BASE001"], owner_id=player.player_id, current_zone=Zone.HAND)
+        event_context = {"event_type": "CARD_PLAYED", "event_subject": spell_inst}
+
+        assert ee.check_condition(create_condition_data(EffectConditionType.EVENT_CARD_IS_TYPE, {"card_type": CardType.SPELL}), player, None, gs, event_context) is True
+        assert ee.check_condition(create_condition_data(EffectConditionType.EVENT_CARD_IS_TYPE, {"card_type": CardType.TOY}), player, None, gs, event_context) is False
+
+    def test_check_condition_malformed_is_false(self, effect_engine_instance: EffectEngine, game_state_with_player: GameState):
+        player = game_state_with_player.get_active_player_state()
+        assert player is not None
+        assert effect_engine_instance.check_condition({"condition_type": "PLAYER_HAS_RESOURCE"}, player, None, game_state_with_player) is False
+
 
 class TestEffectEngineActions:
 
@@ -197,6 +229,189 @@ class TestEffectEngineActions:
         
         assert player.spirit_tokens == initial_spirits + 3
 
+    def test_execute_action_place_counter_on_self(self, effect_engine_instance: EffectEngine, game_state_with_player: GameState, card_defs_for_ee: Dict[str, Card]):
+        ee = effect_engine_instance
+        gs = game_state_with_player
+        player = gs.get_active_player_state()
+        assert player is not None
+
+        source_inst = CardInstance(definition=card_defs_for_ee["T_BASE001"], owner_id=player.player_id, current_zone=Zone.IN_PLAY)
+        gs.cards_in_play[source_inst.instance_id] = source_inst
+        player.zones[Zone.IN_PLAY].append(source_inst)
+
+        action = EffectAction(action_type=EffectActionType.PLACE_COUNTER_ON_CARD,
+                              params={"target_card_id": TargetReference.SELF, "counter_type": "FEEDING", "amount": 2})
+        effect_context = {"player_id": player.player_id, "target_player_id": player.player_id}
+
+        ee._execute_action(action, gs, player, effect_context, source_inst)
+
+        assert source_inst.get_counter("FEEDING") == 2
+
+    def test_execute_action_checks_win_conditions_only_for_win_relevant_actions(self, effect_engine_instance: EffectEngine, game_state_with_player: GameState):
+        ee = effect_engine_instance
+        gs = game_state_with_player
+        player = gs.get_active_player_state()
+        assert player is not None
+        ee.win_loss_checker = MagicMock(spec=WinLossChecker)
+        ee.win_loss_checker.check_all_conditions.return_value = False
+        effect_context = {"player_id": player.player_id, "target_player_id": player.player_id}
+
+        ee._execute_action(EffectAction(action_type=EffectActionType.PLACE_COUNTER_ON_CARD, params={}), gs, player, effect_context)
+        ee.win_loss_checker.check_all_conditions.assert_not_called()
+
+        ee._execute_action(EffectAction(action_type=EffectActionType.ADD_MANA, params={"amount": 1}), gs, player, effect_context)
+        ee.win_loss_checker.check_all_conditions.assert_called_once()
+
+    def test_execute_action_unimplemented_type_logs_warning(self, effect_engine_instance: EffectEngine, game_state_with_player: GameState):
+        ee = effect_engine_instance
+        gs = game_state_with_player
+        player = gs.get_active_player_state()
+        assert player is not None
+
+        action = EffectAction(action_type=EffectActionType.NO_ACTION, params={})
+        effect_context = {"player_id": player.player_id, "target_player_id": player.player_id}
+
+        assert ee._execute_action(action, gs, player, effect_context) == []
+        assert any("NO_ACTION not implemented" in entry for entry in gs.game_log)
+
+    @pytest.mark.parametrize("action_type, params", [
+        (EffectActionType.RETURN_CARD_FROM_ZONE_TO_ZONE, {"card_id": "SELF", "from_zone": "HANDD", "to_zone": "DECK"}),
+        (EffectActionType.EXILE_CARD_FROM_ZONE, {"card_id": "SELF", "from_zone": "GRAVEYARD"}),
+        (EffectActionType.SACRIFICE_RESOURCE, {"resource_type": "SPIRIT_TOKEN", "count": 1}),
+        (EffectActionType.PLAYER_CHOICE, {"choice_type": "CHOOSE_MAYBE"}),
+    ])
+    def test_execute_action_unresolved_enum_param_logs_error(self, effect_engine_instance: EffectEngine, game_state_with_player: GameState, card_defs_for_ee: Dict[str, Card], action_type: EffectActionType, params: Dict[str, Any]):
+        # The loader leaves names it cannot resolve as strings; the handler must report them, not crash
+        ee = effect_engine_instance
+        gs = game_state_with_player
+        player = gs.get_active_player_state()
+        assert player is not None
+        source_card = CardInstance(definition=card_defs_for_ee["T_BASE001"], owner_id=player.player_id, current_zone=Zone.HAND)
+        player.zones[Zone.HAND].append(source_card)
+        spirits_before = player.spirit_tokens
+
+        action = EffectAction(action_type=action_type, params=params)
+        effect_context = {"player_id": player.player_id, "target_player_id": player.player_id}
+
+        assert ee._execute_action(action, gs, player, effect_context, source_card) == []
+        assert any("ERROR" in entry and "Invalid" in entry for entry in gs.game_log)
+        assert source_card.current_zone is Zone.HAND
+        assert player.spirit_tokens == spirits_before
+
+    def test_execute_action_cancel_impending_leave_play_reads_event_subject(self, effect_engine_instance: EffectEngine, game_state_with_player: GameState, card_defs_for_ee: Dict[str, Card]):
+        ee = effect_engine_instance
+        gs = game_state_with_player
+        player = gs.get_active_player_state()
+        assert player is not None
+
+        leaving_inst = CardInstance(definition=card_defs_for_ee["T_BASE001"], owner_id=player.player_id, current_zone=Zone.IN_PLAY)
+        action = EffectAction(action_type=EffectActionType.CANCEL_IMPENDING_LEAVE_PLAY, params={})
+        effect_context = {"player_id": player.player_id, "target_player_id": player.player_id,
+                          "triggering_event_context": {"event_subject": leaving_inst}}
+
+        ee._execute_action(action, gs, player, effect_context, leaving_inst)
+
+        assert any("CANCEL_IMPENDING_LEAVE_PLAY for Base Test Toy" in entry and "processed" in entry for entry in gs.game_log)
+        assert not any("without proper context" in entry for entry in gs.game_log)
+
+    def test_resolve_effect_compiles_actions_once(self, effect_engine_instance: EffectEngine, game_state_with_player: GameState):
+        ee = effect_engine_instance
+        gs = game_state_with_player
+        player = gs.get_active_player_state()
+        assert player is not None
+
+        effect = Effect(effect_id="E_SPIRITS", trigger=EffectTriggerType.ON_PLAY,
+                        actions=[EffectAction(action_type=EffectActionType.CREATE_SPIRIT_TOKENS, params={"count": 2})])
+        assert effect.compiled_actions is None
+        initial_spirits = player.spirit_tokens
+
+        ee.resolve_effect(effect, gs, player)
+        compiled_actions = effect.compiled_actions
+        assert compiled_actions is not None and len(compiled_actions) == 1
+        assert effect.compiled_by is EffectEngine
+
+        ee.resolve_effect(effect, gs, player)
+        assert effect.compiled_actions is compiled_actions
+        assert player.spirit_tokens == initial_spirits + 4
+
+    def test_resolve_effect_recompiles_for_another_engine_class(self, effect_engine_instance: EffectEngine, game_state_with_player: GameState):
+        gs = game_state_with_player
+        player = gs.get_active_player_state()
+        assert player is not None
+
+        class NoSpiritsEngine(EffectEngine):
+            def _do_no_spirits(self, action, game_state, player, effect_context, card_instance):
+                return None
+            _ACTION_HANDLERS = {**EffectEngine._ACTION_HANDLERS, EffectActionType.CREATE_SPIRIT_TOKENS: _do_no_spirits}
+
+        effect = Effect(effect_id="E_SPIRITS", trigger=EffectTriggerType.ON_PLAY,
+                        actions=[EffectAction(action_type=EffectActionType.CREATE_SPIRIT_TOKENS, params={"count": 2})])
+        initial_spirits = player.spirit_tokens
+
+        effect_engine_instance.resolve_effect(effect, gs, player)
+        assert player.spirit_tokens == initial_spirits + 2
+
+        # A plan compiled by the base engine must not be reused with the subclass's handlers
+        NoSpiritsEngine(gs, effect_engine_instance.win_loss_checker).resolve_effect(effect, gs, player)
+        assert effect.compiled_by is NoSpiritsEngine
+        assert player.spirit_tokens == initial_spirits + 2
+
+    def test_resolve_effect_builds_context_without_touching_template(self, effect_engine_instance: EffectEngine, game_state_with_player: GameState, card_defs_for_ee: Dict[str, Card]):
+        ee = effect_engine_instance
+        gs = game_state_with_player
+        player = gs.get_active_player_state()
+        assert player is not None
+        source_inst = CardInstance(definition=card_defs_for_ee["T_BASE001"], owner_id=player.player_id, current_zone=Zone.IN_PLAY)
+        effect = Effect(effect_id="E_CTX", trigger=EffectTriggerType.ON_PLAY,
+                        actions=[EffectAction(action_type=EffectActionType.NO_ACTION, params={})])
+        template_before = dict(effect.context_template)
+        ee._run_action = MagicMock(return_value=[])
+
+        ee.resolve_effect(effect, gs, player, source_inst, {"event_subject": source_inst})
+
+        effect_context = ee._run_action.call_args[0][5]
+        assert effect_context["effect_id"] == "E_CTX"
+        assert effect_context["source_card_instance_id"] == source_inst.instance_id
+        assert effect_context["source_card_definition_id"] == "T_BASE001"
+        assert effect_context["player_id"] == player.player_id
+        assert effect.context_template == template_before
+
+    def test_resolve_effect_without_actions_skips_condition(self, effect_engine_instance: EffectEngine, game_state_with_player: GameState):
+        ee = effect_engine_instance
+        gs = game_state_with_player
+        player = gs.get_active_player_state()
+        assert player is not None
+        ee.check_condition = MagicMock(return_value=True)
+
+        effect = Effect(effect_id="E_EMPTY", trigger=EffectTriggerType.ON_PLAY, actions=[],
+                        condition=create_condition_data(EffectConditionType.DECK_SIZE_LE, {"count": 99}))
+
+        assert ee.resolve_effect(effect, gs, player) == []
+        ee.check_condition.assert_not_called()
+
+    def test_resolve_effect_runs_conditional_branch_before_next_action(self, effect_engine_instance: EffectEngine, game_state_with_player: GameState):
+        ee = effect_engine_instance
+        gs = game_state_with_player
+        player = gs.get_active_player_state()
+        assert player is not None
+        initial_spirits = player.spirit_tokens
+        initial_memories = player.memory_tokens
+
+        conditional = EffectAction(action_type=EffectActionType.CONDITIONAL_EFFECT, params={
+            "condition": None,
+            "on_true_actions": [EffectAction(action_type=EffectActionType.CREATE_SPIRIT_TOKENS, params={"count": 2})],
+        })
+        effect = Effect(effect_id="E_COND", trigger=EffectTriggerType.ON_PLAY,
+                        actions=[conditional, EffectAction(action_type=EffectActionType.CREATE_MEMORY_TOKENS, params={"count": 1})])
+
+        ee.resolve_effect(effect, gs, player)
+
+        assert player.spirit_tokens == initial_spirits + 2
+        assert player.memory_tokens == initial_memories + 1
+        spirit_log_index = next(i for i, entry in enumerate(gs.game_log) if "creates 2 Spirit(s)" in entry)
+        memory_log_index = next(i for i, entry in enumerate(gs.game_log) if "creates 1 Memory(s)" in entry)
+        assert spirit_log_index < memory_log_index
+
 
 class TestPlayerChoiceExecution:
     def test_player_choice_yes_no_ai_chooses_yes_cancels_leave_play(
@@ -237,4 +452,6 @@ class TestPlayerChoiceExecution:
         assert choice_context_arg['choice_type'] == PlayerChoiceType.CHOOSE_YES_NO
         assert choice_context_arg['prompt_text'] == "Echo Bear would leave play. Create a Memory Token and keep it in play instead?"
 
-        assert player.memory_tokens == initial_memory_tokens + 1
\ No newline at end of file
+        assert player.memory_tokens == initial_memory_tokens + 1
+        # The CANCEL_IMPENDING_LEAVE_PLAY sub-action goes through its own handler
+        assert any("CANCEL_IMPENDING_LEAVE_PLAY for Echo Bear" in entry and "processed" in entry for entry in gs.game_log)
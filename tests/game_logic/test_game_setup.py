@@ -1,8 +1,9 @@
 # tests/game_logic/test_game_setup.py
+import random
 import pytest
 from typing import Dict, List
 
-from tuck_in_terrors_sim.game_logic.game_setup import initialize_new_game, DEFAULT_PLAYER_ID, INITIAL_HAND_SIZE
+from tuck_in_terrors_sim.game_logic.game_setup import initialize_new_game, _build_deck_definitions, DeckDefPool, DEFAULT_PLAYER_ID, INITIAL_HAND_SIZE
 from tuck_in_terrors_sim.game_logic.game_state import GameState, PlayerState
 from tuck_in_terrors_sim.game_elements.card import Card, CardInstance, Toy
 from tuck_in_terrors_sim.game_elements.objective import ObjectiveCard
@@ -147,4 +148,46 @@ class TestGameSetup:
         #         "First Memory (if chosen from deck to hand) should not also be a separate instance in play unless it's the Ghost Doll."
 
         assert len(player.zones[Zone.HAND]) == INITIAL_HAND_SIZE
-        assert gs.current_turn == 1
\ No newline at end of file
+        assert gs.current_turn == 1
+
+    def test_deck_def_pool_keeps_order(self, all_card_definitions_dict: Dict[str, Card]):
+        card_defs = list(all_card_definitions_dict.values())[:4]
+        pool = DeckDefPool(list(card_defs))
+
+        assert pool.pop_by_id(card_defs[1].card_id) is card_defs[1]
+        assert pool.pop_by_id(card_defs[1].card_id) is None
+        assert pool.pop_top() is card_defs[0]
+        pool.put_on_bottom([card_defs[0]])
+
+        assert len(pool) == 3
+        assert list(pool) == [card_defs[2], card_defs[3], card_defs[0]]
+        assert pool.get(card_defs[0].card_id) is card_defs[0]
+
+    def test_deck_def_pool_pop_first_of_type(self, all_card_definitions_dict: Dict[str, Card]):
+        card_defs = list(all_card_definitions_dict.values())
+        pool = DeckDefPool(list(card_defs))
+        first_toy = next(card_def for card_def in card_defs if card_def.type is CardType.TOY)
+
+        assert pool.pop_first_of_type(CardType.TOY) is first_toy
+        assert pool.get(first_toy.card_id) is None
+        assert len(pool) == len(card_defs) - 1
+
+    def test_build_deck_definitions_reuses_template(self,
+                                                   objective_def_first_night: ObjectiveCard,
+                                                   all_card_definitions_dict: Dict[str, Card]):
+        first = _build_deck_definitions(all_card_definitions_dict, objective_def_first_night)
+        first.pop_top() # Changes to one game's pool must not leak into the next
+        second = _build_deck_definitions(all_card_definitions_dict, objective_def_first_night)
+
+        assert len(second) == len(all_card_definitions_dict)
+        assert sorted(c.card_id for c in second) == sorted(all_card_definitions_dict)
+
+    def test_initialize_new_game_with_seeded_rng_is_reproducible(self,
+                                                                 objective_def_first_night: ObjectiveCard,
+                                                                 all_card_definitions_dict: Dict[str, Card]):
+        def deck_order(seed: int) -> List[str]:
+            gs = initialize_new_game(objective_def_first_night, all_card_definitions_dict, rng=random.Random(seed))
+            player = gs.get_active_player_state()
+            return [ci.definition.card_id for ci in player.zones[Zone.HAND]] + [ci.definition.card_id for ci in player.zones[Zone.DECK]]
+
+        assert deck_order(7) == deck_order(7)
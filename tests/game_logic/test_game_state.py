@@ -7,7 +7,7 @@ from typing import Dict, List
 from tuck_in_terrors_sim.game_elements.card import Card, Toy
 from tuck_in_terrors_sim.game_elements.objective import ObjectiveCard, ObjectiveLogicComponent
 from tuck_in_terrors_sim.game_elements.enums import CardType, Zone, TurnPhase
-from tuck_in_terrors_sim.game_logic.game_state import GameState
+from tuck_in_terrors_sim.game_logic.game_state import GameState, PlayerState
 # If the test needs CardInstance, add:
 # from tuck_in_terrors_sim.game_elements.card import CardInstance
 # --- Test Fixtures / Mock Data ---
@@ -157,6 +157,9 @@ class TestGameState:
             assert "primary_toys_needed" in gs.objective_progress 
             assert "primary_spirits_needed" in gs.objective_progress
 
+        gs.objective_progress["unseeded_counter"] += 2 # Counters not seeded above still start at zero
+        assert gs.objective_progress["unseeded_counter"] == 2
+
         # These are now on PlayerState or GameState flags managed by TurnManager
         # assert not gs.free_toy_played_this_turn
         # assert not gs.flashback_used_this_game
@@ -180,6 +183,15 @@ class TestGameState:
         assert len(gs.game_log) == 2
         assert "[ERROR][T1][MAIN_PHASE] Another message." in gs.game_log[1]
 
+    def test_add_log_entry_drops_debug_levels_when_disabled(self, initial_game_state: GameState):
+        gs = initial_game_state
+        gs.debug_log_enabled = False
+
+        gs.add_log_entry("Traced detail.", level="ACTION_DETAIL")
+        gs.add_log_entry("Something odd.", level="WARNING")
+        assert len(gs.game_log) == 1
+        assert "[WARNING]" in gs.game_log[0]
+
     def test_get_card_instance(self, initial_game_state: GameState, mock_card_definitions):
         # This test needs to be updated based on CardInstance and how cards are added to zones/play
         gs = initial_game_state
@@ -230,4 +242,59 @@ class TestGameState:
         # assert len(player.zones[Zone.DISCARD]) == initial_discard_len
         # Log check would need to be adapted for new logging in move_card_zone
         # assert f"Card {non_existent_card_in_hand_inst.instance_id} not found in player 0's zone HAND" in gs.game_log[-1]
-        pass # Commenting out for now.
\ No newline at end of file
+        pass # Commenting out for now.
+
+    def test_silent_logging_keeps_only_problem_entries(self, mock_objective: ObjectiveCard, mock_card_definitions: Dict[str, Card]):
+        gs = GameState(loaded_objective=mock_objective, all_card_definitions=mock_card_definitions, silent_logging=True)
+
+        gs.add_log_entry("Ignored.")
+        gs.add_log_entry("Traced detail.", level="ACTION_DETAIL")
+        gs.add_log_entry("First Memory definition not found.", level="ERROR")
+        gs.add_log_entry("Unknown setup instruction.", level="WARNING")
+        assert len(gs.game_log) == 2
+        assert "[ERROR]" in gs.game_log[0] and "First Memory definition not found." in gs.game_log[0]
+        assert "[WARNING]" in gs.game_log[1]
+        assert not gs.debug_log_enabled
+        assert not gs.log_enabled
+
+    def test_game_state_is_slotted(self, initial_game_state: GameState):
+        assert not hasattr(initial_game_state, "__dict__")
+        with pytest.raises(AttributeError):
+            initial_game_state.curent_turn = 2 # Misspelled attribute names fail instead of silently adding state
+
+    def test_log_prefix_follows_current_phase(self, initial_game_state: GameState):
+        gs = initial_game_state
+        gs.add_log_entry("Before.")
+        gs.current_phase = TurnPhase.MAIN_PHASE
+        gs.add_log_entry("During.")
+        assert gs.game_log[-2].endswith("[SETUP] Before.")
+        assert gs.game_log[-1].endswith("[MAIN_PHASE] During.")
+        assert gs.current_phase is TurnPhase.MAIN_PHASE
+
+
+class TestPlayerState:
+    def test_draw_cards_takes_from_top_and_stops_at_empty_deck(self, initial_game_state: GameState, mock_card_definitions):
+        gs = initial_game_state
+        gs.current_turn = 1
+        player = PlayerState(player_id=0, initial_deck=[mock_card_definitions["TCTOY001"], mock_card_definitions["TCSPL001"]])
+        top_card = player.zones[Zone.DECK][0]
+
+        drawn = player.draw_cards(3, gs)
+
+        assert len(drawn) == 2
+        assert drawn[0] is top_card
+        assert len(player.zones[Zone.DECK]) == 0
+        assert player.zones[Zone.HAND] == drawn
+        assert all(ci.current_zone == Zone.HAND for ci in drawn)
+        assert "deck is empty" in gs.game_log[-1]
+
+    def test_mill_deck_moves_top_cards_to_discard(self, initial_game_state: GameState, mock_card_definitions):
+        gs = initial_game_state
+        player = PlayerState(player_id=0, initial_deck=[mock_card_definitions["TCTOY001"], mock_card_definitions["TCSPL001"]])
+        top_card, second_card = player.zones[Zone.DECK]
+
+        player.mill_deck(1, gs)
+
+        assert player.zones[Zone.DISCARD] == [top_card]
+        assert list(player.zones[Zone.DECK]) == [second_card]
+        assert top_card.current_zone == Zone.DISCARD
@@ -139,6 +139,8 @@ class TestTurnManager:
 
         assert player.mana == 0 
         assert len(player.zones[Zone.HAND]) == STANDARD_MAX_HAND_SIZE
+        assert len(player.zones[Zone.DISCARD]) == 2
+        assert not any("for removal" in log for log in game_state.game_log)
         turn_manager.win_loss_checker.check_all_conditions.assert_called_once() # Check if the mocked method was called
 
     def test_execute_full_turn_flow(self, initialized_game_environment: Tuple[GameState, ActionResolver, EffectEngine, TurnManager, NightmareCreepModule, WinLossChecker]):